@@ -0,0 +1,60 @@
+"""PID file handling for the reminder daemon.
+
+Shared by the reminder CLI, which writes the PID file, and the MCP server,
+which only checks it. Kept free of GUI imports so the server never loads wx.
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import Optional
+
+from todo_list_mcp.settings import get_settings
+
+PID_FILE = Path(get_settings().app_data_dir) / "reminder_daemon" / "daemon.pid"
+
+
+def read_pid(pid_file: Path = PID_FILE) -> Optional[int]:
+    """Return the PID stored in the PID file, or None if missing or malformed."""
+    try:
+        pid = int(pid_file.read_text().strip())
+    except (FileNotFoundError, ValueError):
+        return None
+    return pid if pid > 0 else None
+
+
+def is_daemon_running(pid_file: Path = PID_FILE) -> bool:
+    """Check whether the PID file names a live process.
+
+    A process owned by another user (EPERM) still counts as running. A PID
+    file naming a process that no longer exists is stale and is removed.
+    """
+    pid = read_pid(pid_file)
+    if pid is None:
+        return False
+    # os.kill() terminates the process on Windows whatever the signal, so the
+    # PID file is trusted there (the daemon removes it on shutdown)
+    if sys.platform == "win32":
+        return True
+    try:
+        os.kill(pid, 0)  # Signal 0 just checks if process exists
+    except PermissionError:
+        return True
+    except ProcessLookupError:
+        pid_file.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def write_pid_file(pid_file: Path = PID_FILE) -> None:
+    """Write the current process PID to the PID file."""
+    pid_file.parent.mkdir(parents=True, exist_ok=True)
+    pid_file.write_text(str(os.getpid()))
+
+
+def remove_pid_file(pid_file: Path = PID_FILE) -> None:
+    """Remove the PID file on shutdown."""
+    try:
+        pid_file.unlink(missing_ok=True)
+    except OSError:
+        pass
@@ -518,7 +518,8 @@ class GitHubFileClient:
         """Move multiple files in a single commit.
 
         Uses a single tree/commit to minimize GitHub API calls. Sources are
-        fetched via a single GraphQL query when possible.
+        fetched via a single GraphQL query when possible, and their existing
+        blob SHAs are reused for the targets, so no content is re-uploaded.
         """
 
         branch_name = branch or self.default_branch
@@ -539,7 +540,8 @@ class GitHubFileClient:
                 continue
 
             source_content = source_lookup[source_path]
-            blob_sha = self._create_blob(source_content.content)
+            # Git blobs are content-addressed: the moved file keeps its blob.
+            blob_sha = source_content.sha or self._create_blob(source_content.content)
 
             tree_entries.append(
                 {
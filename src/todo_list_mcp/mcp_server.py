@@ -9,30 +9,56 @@ which is automatically started when the MCP server starts (if not already runnin
 
 from __future__ import annotations
 
+import json
+import re
 import subprocess
 import sys
-from datetime import UTC, datetime
-from typing import Annotated, List, Literal, Optional
+import threading
+from functools import partial
+from typing import Annotated, List, Optional
 
 from fastmcp import FastMCP
 from loguru import logger
-from pydantic import BaseModel, Field, model_validator
-from sqlalchemy import select
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import defer
 
+from todo_list_mcp.daemon_pid import is_daemon_running
 from todo_list_mcp.logging_config import setup_logging
-from todo_list_mcp.models import Base, Task
+from todo_list_mcp.models import (
+    TASK_LEVELS,
+    TASK_LIST_ORDER,
+    TASK_STATUSES,
+    Base,
+    Task,
+    TaskLevel,
+    TaskStatus,
+    backfill_due_ts,
+    iso_to_epoch,
+    parse_iso,
+    utc_now_iso,
+)
 from todo_list_mcp.settings import get_settings
 from todo_list_mcp.sqlite_client import SQLiteClient
 
 # ---------------------------------------------------------------------------
 # Models
 
-Status = Literal["open", "in-progress", "done"]
-Priority = Literal["low", "medium", "high"]
-Urgency = Literal["low", "medium", "high"]
+Status = TaskStatus
+Priority = TaskLevel
+Urgency = TaskLevel
+
+# Values update_tasks accepts for the enumerated columns
+_ENUM_FIELDS = {
+    "status": TASK_STATUSES,
+    "priority": TASK_LEVELS,
+    "urgency": TASK_LEVELS,
+}
 
 
 class TaskPayload(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     title: str = Field(description="Task title or summary")
     description: Optional[str] = Field(
         None, description="Detailed task description or notes"
@@ -65,37 +91,39 @@ class TaskPayload(BaseModel):
     updated_at: Optional[str] = Field(
         None, description="Last update timestamp in ISO 8601 format"
     )
+    due_ts: Optional[float] = Field(
+        None,
+        exclude=True,
+        description="Due date as epoch seconds (derived from due_date)",
+    )
 
-    @model_validator(mode="before")
-    def normalize_lists(cls, values: dict) -> dict:  # type: ignore[override]
-        tags = values.get("tags")
-        if tags is None:
-            values["tags"] = []
-        return values
+    @field_validator("tags", mode="before")
+    @classmethod
+    def normalize_lists(cls, value: Optional[List[str]]) -> List[str]:
+        return [] if value is None else value
+
+    @model_validator(mode="after")
+    def derive_due_ts(self) -> "TaskPayload":
+        self.due_ts = iso_to_epoch(self.due_date)
+        return self
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 
 
-def _now_iso() -> str:
-    return datetime.now(tz=UTC).isoformat()
+# Legacy filename formats like "1", "task-1.yaml", "tasks/1.yaml", "archive/1.yaml"
+_TASK_FILENAME_RE = re.compile(
+    r"\s*(?:tasks/|archive/)*(?:task-)?(-?\d+)(?:\.yaml)?\s*"
+)
 
 
-def _parse_iso(value: str) -> Optional[datetime]:
-    try:
-        cleaned = value.replace("Z", "+00:00")
-        dt = datetime.fromisoformat(cleaned)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=UTC)
-        return dt.astimezone(UTC)
-    except Exception:
+def _task_id_from_filename(filename: object) -> Optional[int]:
+    """Extract a task ID from a legacy filename, or None if it doesn't match."""
+    if not isinstance(filename, str):
         return None
-
-
-def _priority_order(priority: str) -> int:
-    order = {"high": 0, "medium": 1, "low": 2}
-    return order.get(priority, 3)
+    match = _TASK_FILENAME_RE.fullmatch(filename)
+    return int(match.group(1)) if match else None
 
 
 # ---------------------------------------------------------------------------
@@ -105,9 +133,19 @@ settings = get_settings()
 setup_logging(settings)
 
 # Initialize SQLite client and create tables
-db_client = SQLiteClient(database_url=settings.database_url)
+# Tags are stored as a JSON column; compact separators keep the encoded rows
+# small and skip the default ", "/": " padding on every write.
+db_client = SQLiteClient(
+    database_url=settings.database_url,
+    json_serializer=partial(json.dumps, separators=(",", ":")),
+)
 db_client.ensure_database_exists()
 db_client.create_tables(Base)
+db_client.upgrade_tables(Base)
+
+
+with db_client.transaction() as session:
+    backfill_due_ts(session)
 
 logger.info(
     "SQLite database initialized",
@@ -159,6 +197,10 @@ def create_tasks(
         Optional[List[str]],
         "Deprecated parameter (kept for backward compatibility). Filenames are no longer used with SQLite storage.",
     ] = None,
+    return_tasks: Annotated[
+        bool,
+        "If true, also return the stored tasks (same shape as read_tasks) so no follow-up read is needed",
+    ] = False,
 ) -> dict:
     """Create one or more tasks in the SQLite database.
 
@@ -172,40 +214,47 @@ def create_tasks(
     tasks=[{"title": "Task 1"}, {"title": "Task 2"}]
     """
     task_objects = [TaskPayload(**task) for task in tasks]
-    created_ids: List[int] = []
 
-    with db_client.transaction() as session:
-        for task_payload in task_objects:
-            now_iso = _now_iso()
-            task_payload.created_at = task_payload.created_at or now_iso
-            task_payload.updated_at = now_iso
-
-            # Create Task ORM instance
-            task_orm = Task(
-                title=task_payload.title,
-                description=task_payload.description,
-                status=task_payload.status,
-                priority=task_payload.priority,
-                urgency=task_payload.urgency,
-                time_estimate=task_payload.time_estimate,
-                due_date=task_payload.due_date,
-                tags=task_payload.tags or [],
-                assignee=task_payload.assignee,
-                created_at=task_payload.created_at,
-                updated_at=task_payload.updated_at,
-            )
-            db_client.add(session, task_orm)
-            session.flush()  # Flush to get the ID
-            created_ids.append(task_orm.id)
+    # One timestamp for the whole batch rather than a default call per row
+    now_iso = utc_now_iso()
+    rows = [
+        {
+            "title": task_payload.title,
+            "description": task_payload.description,
+            "status": task_payload.status,
+            "priority": task_payload.priority,
+            "urgency": task_payload.urgency,
+            "time_estimate": task_payload.time_estimate,
+            "due_date": task_payload.due_date,
+            "due_ts": task_payload.due_ts,
+            "tags": task_payload.tags or [],
+            "assignee": task_payload.assignee,
+            "created_at": task_payload.created_at or now_iso,
+            "updated_at": now_iso,
+        }
+        for task_payload in task_objects
+    ]
 
-            logger.info(
-                "Created task",
-                task_id=task_orm.id,
-                title=task_orm.title,
-                status=task_orm.status,
-            )
+    with db_client.transaction() as session:
+        # Single INSERT ... RETURNING for the whole batch
+        created_ids: List[int] = db_client.insert_many(session, Task, rows)
+
+    for task_id, row in zip(created_ids, rows):
+        logger.info(
+            "Created task",
+            task_id=task_id,
+            title=row["title"],
+            status=row["status"],
+        )
 
-    return {"created": created_ids, "count": len(created_ids)}
+    result: dict = {"created": created_ids, "count": len(created_ids)}
+    if return_tasks:
+        # The inserted rows are exactly what was stored; no need to re-read
+        result["tasks"] = [
+            {"id": task_id, "task": Task(**row).to_dict()}
+            for task_id, row in zip(created_ids, rows)
+        ]
+    return result
 
 
 @app.tool()
@@ -233,18 +282,10 @@ def read_tasks(
         task_ids.extend(ids)
     if filenames:
         for fn in filenames:
-            # Try to extract numeric ID from filename
-            try:
-                # Handle formats like "1", "task-1.yaml", "tasks/1.yaml"
-                id_str = (
-                    fn.replace("tasks/", "")
-                    .replace("archive/", "")
-                    .replace(".yaml", "")
-                    .replace("task-", "")
-                )
-                task_id = int(id_str)
+            task_id = _task_id_from_filename(fn)
+            if task_id is not None:
                 task_ids.append(task_id)
-            except (ValueError, AttributeError):
+            else:
                 logger.warning(f"Could not parse task ID from filename: {fn}")
 
     if not task_ids:
@@ -252,8 +293,10 @@ def read_tasks(
 
     results = []
     with db_client.session() as session:
+        # Fetch all requested rows in one query, then keep input order
+        tasks_by_id = db_client.get_by_ids(session, Task, task_ids)
         for task_id in task_ids:
-            task = db_client.get_by_id(session, Task, task_id)
+            task = tasks_by_id.get(task_id)
             if task:
                 results.append(
                     {
@@ -300,6 +343,10 @@ def update_tasks(
             "assignee": "John Doe"
         }""",
     ],
+    return_tasks: Annotated[
+        bool,
+        "If true, also return the stored tasks (same shape as read_tasks) so no follow-up read is needed",
+    ] = False,
 ) -> dict:
     """Update one or more existing tasks in the SQLite database.
 
@@ -314,45 +361,57 @@ def update_tasks(
     """
     updated_ids: List[int] = []
 
-    with db_client.transaction() as session:
-        for item in updates:
-            # Support both 'id' and 'filename' for backward compatibility
-            task_id = item.get("id")
-            if task_id is None and "filename" in item:
-                # Try to extract ID from filename
-                try:
-                    filename = item["filename"]
-                    id_str = (
-                        filename.replace("tasks/", "")
-                        .replace("archive/", "")
-                        .replace(".yaml", "")
-                        .replace("task-", "")
-                    )
-                    task_id = int(id_str)
-                except (ValueError, AttributeError):
-                    logger.warning(
-                        f"Could not parse task ID from filename: {item.get('filename')}"
-                    )
-                    continue
-
+    targets: List[tuple[int, dict]] = []
+    for item in updates:
+        # Support both 'id' and 'filename' for backward compatibility
+        task_id = item.get("id")
+        if isinstance(task_id, str):
+            # Numeric strings like "1" are still accepted as IDs
+            task_id = _task_id_from_filename(task_id)
+        if task_id is None and "filename" in item:
+            task_id = _task_id_from_filename(item["filename"])
             if task_id is None:
-                logger.warning("Update item missing 'id' field")
+                logger.warning(
+                    f"Could not parse task ID from filename: {item.get('filename')}"
+                )
                 continue
 
-            task = db_client.get_by_id(session, Task, task_id)
+        if task_id is None:
+            logger.warning("Update item missing 'id' field")
+            continue
+        for key, allowed in _ENUM_FIELDS.items():
+            if key in item and item[key] not in allowed:
+                raise ValueError(
+                    f"Invalid {key} {item[key]!r} for task {task_id}; "
+                    f"expected one of {', '.join(allowed)}"
+                )
+        targets.append((task_id, item))
+
+    with db_client.transaction() as session:
+        # Load every target row in one query instead of one per update
+        tasks_by_id = db_client.get_by_ids(
+            session, Task, [task_id for task_id, _ in targets]
+        )
+        for task_id, item in targets:
+            task = tasks_by_id.get(task_id)
             if not task:
                 logger.warning(f"Task not found: {task_id}")
                 continue
 
-            # Update fields
+            # Update only fields whose value actually changes
+            changed_fields = []
             for key, value in item.items():
-                if key in ("id", "filename"):
+                if key in ("id", "filename", "due_ts"):
                     continue
-                if hasattr(task, key):
+                if hasattr(task, key) and getattr(task, key) != value:
                     setattr(task, key, value)
+                    changed_fields.append(key)
 
-            # Auto-update timestamp
-            task.updated_at = _now_iso()
+            # Re-derive due_ts only on real changes; updated_at is bumped by the
+            # model's onupdate when the row is written, so no-op updates
+            # don't write the row
+            if "due_date" in changed_fields:
+                task.due_ts = iso_to_epoch(task.due_date)
             updated_ids.append(task_id)
 
             logger.info(
@@ -361,7 +420,15 @@ def update_tasks(
                 updated_fields=list(item.keys()),
             )
 
-    return {"updated": updated_ids, "count": len(updated_ids)}
+    result: dict = {"updated": updated_ids, "count": len(updated_ids)}
+    if return_tasks:
+        # Sessions don't expire on commit, so the loaded rows already hold
+        # the committed values (including the onupdate updated_at)
+        result["tasks"] = [
+            {"id": task_id, "task": tasks_by_id[task_id].to_dict()}
+            for task_id in updated_ids
+        ]
+    return result
 
 
 @app.tool()
@@ -386,15 +453,24 @@ def delete_tasks(
     not_found_ids: List[int] = []
 
     with db_client.transaction() as session:
-        for task_id in ids:
-            task = db_client.get_by_id(session, Task, task_id)
-            if task:
-                db_client.delete(session, task)
-                deleted_ids.append(task_id)
-                logger.info("Deleted task", task_id=task_id, title=task.title)
-            else:
-                not_found_ids.append(task_id)
-                logger.warning(f"Task not found: {task_id}")
+        # One DELETE ... RETURNING; no rows are loaded into the session first
+        stmt = (
+            delete(Task)
+            .where(Task.id.in_(set(ids)))
+            .returning(Task.id, Task.title)
+            .execution_options(synchronize_session=False)
+        )
+        titles_by_id = dict(session.execute(stmt).all())
+
+    # Repeated IDs are reported once, in first-seen order
+    for task_id in dict.fromkeys(ids):
+        title = titles_by_id.get(task_id)
+        if title is not None:
+            deleted_ids.append(task_id)
+            logger.info("Deleted task", task_id=task_id, title=title)
+        else:
+            not_found_ids.append(task_id)
+            logger.warning(f"Task not found: {task_id}")
 
     result = {
         "deleted": deleted_ids,
@@ -409,19 +485,19 @@ def delete_tasks(
 @app.tool()
 def list_tasks(
     status: Annotated[
-        Optional[list[Literal["open", "in-progress", "done"]]],
+        Optional[list[Status]],
         """Filter by status(es): list of 'open', 'in-progress', or 'done'. 
         Can specify one or more statuses (e.g., ["open"], ["open", "in-progress"]).
         If not provided, all statuses are included.""",
     ] = None,
     priority: Annotated[
-        Optional[list[Literal["low", "medium", "high"]]],
+        Optional[list[Priority]],
         """Filter by priority(ies): list of 'low', 'medium', or 'high'. 
         Can specify one or more priorities (e.g., ["high"], ["high", "medium"]).
         If not provided, all priorities are included.""",
     ] = None,
     urgency: Annotated[
-        Optional[list[Literal["low", "medium", "high"]]],
+        Optional[list[Urgency]],
         """Filter by urgency level(s): list of 'low', 'medium', or 'high'. 
         Can specify one or more urgencies (e.g., ["high"], ["high", "medium"]).
         If not provided, all urgencies are included.""",
@@ -493,67 +569,55 @@ def list_tasks(
         if urgency:
             stmt = stmt.where(Task.urgency.in_(urgency))
 
+        # Filter by tags (must have all specified tags)
+        for tag in set(tags or []):
+            tag_values = func.json_each(Task.tags).table_valued("value")
+            stmt = stmt.where(
+                select(tag_values.c.value).where(tag_values.c.value == tag).exists()
+            )
+
         # Filter by assignee
         if assignee:
             stmt = stmt.where(Task.assignee == assignee)
 
-        # Filter by due date
+        # Filter by due date (compared as epoch seconds)
         if due_before:
-            before_dt = _parse_iso(due_before)
+            before_dt = parse_iso(due_before)
             if before_dt:
-                stmt = stmt.where(Task.due_date <= due_before)
+                stmt = stmt.where(Task.due_ts <= before_dt.timestamp())
 
         if due_after:
-            after_dt = _parse_iso(due_after)
+            after_dt = parse_iso(due_after)
             if after_dt:
-                stmt = stmt.where(Task.due_date >= due_after)
-
-        # Execute query
-        all_tasks = session.scalars(stmt).all()
-
-        # Filter by tags (must have all specified tags) - done in Python since JSON filtering is complex
-        filtered_tasks = []
-        for task in all_tasks:
-            if tags:
-                task_tags = set(task.tags or [])
-                required_tags = set(tags)
-                if not required_tags.issubset(task_tags):
-                    continue
-            filtered_tasks.append(task)
-
-        # Sort by priority and due date
-        def _sort_key(task: Task) -> tuple:
-            due_dt = _parse_iso(task.due_date) if task.due_date else None
-            fallback = datetime.max.replace(tzinfo=UTC)
-            return (
-                _priority_order(task.priority),
-                due_dt or fallback,
-            )
+                stmt = stmt.where(Task.due_ts >= after_dt.timestamp())
 
-        filtered_tasks.sort(key=_sort_key)
+        total = session.execute(
+            select(func.count()).select_from(stmt.subquery())
+        ).scalar_one()
 
         # Paginate
         page_val = max(1, page)
         size = max(1, min(100, page_size))
         start = (page_val - 1) * size
-        end = start + size
-        page_tasks = filtered_tasks[start:end]
 
-        # Convert to dict format
-        results = []
-        for task in page_tasks:
-            task_dict = task.to_dict()
+        # Skip the sorted page query when nothing matches or the page is past the end
+        page_tasks = []
+        if start < total:
+            # Sort by priority and due date (tasks without a due date last)
+            stmt = stmt.order_by(*TASK_LIST_ORDER)
             if not include_description:
-                task_dict.pop("description", None)
-            results.append(
-                {
-                    "id": task.id,
-                    "task": task_dict,
-                }
-            )
+                # Descriptions can be long; don't load them just to drop them
+                stmt = stmt.options(defer(Task.description))
+            page_tasks = session.scalars(stmt.limit(size).offset(start)).all()
+
+        # Convert to dict format
+        results = [
+            {"id": task.id, "task": task.to_dict(include_description)}
+            for task in page_tasks
+        ]
 
         return {
-            "total": len(filtered_tasks),
+            "total": total,
             "page": page_val,
             "page_size": size,
             "tasks": results,
@@ -564,28 +628,36 @@ def list_tasks(
 # Reminder management tools (communicate with reminder_cli daemon)
 
 
-def _run_reminder_cli(args: List[str]) -> tuple[str, int]:
-    """Run the reminder CLI command and return (output, exit_code)."""
+def _run_reminder_cli_streams(
+    args: List[str], input_text: Optional[str] = None
+) -> tuple[str, str, int]:
+    """Run the reminder CLI command and return (stdout, stderr, exit_code)."""
     try:
         result = subprocess.run(
             [sys.executable, "-m", "todo_list_mcp.reminder_cli"] + args,
+            input=input_text,
             capture_output=True,
             text=True,
             timeout=10,
         )
-        return result.stdout + result.stderr, result.returncode
+        return result.stdout, result.stderr, result.returncode
     except subprocess.TimeoutExpired:
-        return "Command timed out", 1
+        return "", "Command timed out", 1
     except Exception as e:
-        return f"Error running command: {e}", 1
+        return "", f"Error running command: {e}", 1
+
+
+def _run_reminder_cli(
+    args: List[str], input_text: Optional[str] = None
+) -> tuple[str, int]:
+    """Run the reminder CLI command and return (output, exit_code)."""
+    stdout, stderr, code = _run_reminder_cli_streams(args, input_text)
+    return stdout + stderr, code
 
 
 def _ensure_daemon_running() -> None:
     """Ensure reminder daemon is running. Start it if not already running."""
-    # Check daemon status
-    output, code = _run_reminder_cli(["status"])
-
-    if code == 0:
+    if is_daemon_running():
         # Daemon is already running
         logger.info("Reminder daemon is already running")
         return
@@ -605,8 +677,7 @@ def _ensure_daemon_running() -> None:
         time.sleep(0.5)
 
         # Verify it started
-        output, code = _run_reminder_cli(["status"])
-        if code == 0:
+        if is_daemon_running():
             logger.info("Reminder daemon started successfully")
         else:
             logger.warning("Reminder daemon may not have started properly")
@@ -674,33 +745,49 @@ def set_reminders(
         {"title": "Task B reminder", "message": "Work on B", "due_at": "2026-01-15T14:00:00Z", "task_filename": "tasks/task-b.yaml"}
     ]
     """
-    results = []
+    results: List[Optional[dict]] = []
+    batch: List[dict] = []
     for reminder in reminders:
-        title = reminder.get("title", "Reminder")
-        message = reminder.get("message", "")
         due_at = reminder.get("due_at", "")
-        # Use reminder-specific task_filename, fall back to request-level one
-        reminder_task_filename = reminder.get("task_filename") or task_filename
-
         if not due_at:
             results.append({"error": "Missing due_at timestamp", "reminder": reminder})
             continue
+        results.append(None)  # Filled from the batch output below
+        batch.append(
+            {
+                "title": reminder.get("title", "Reminder"),
+                "message": reminder.get("message", ""),
+                "due_at": due_at,
+                # Use reminder-specific task_filename, fall back to request-level one
+                "task_filename": reminder.get("task_filename") or task_filename,
+            }
+        )
 
-        args = ["add", title, message, due_at]
-        if reminder_task_filename:
-            args.extend(["--task", reminder_task_filename])
-        output, code = _run_reminder_cli(args)
-        if code == 0:
-            # Extract ID from output if possible
-            reminder_id = "unknown"
-            for line in output.split("\n"):
-                if "Reminder added:" in line:
-                    parts = line.split(":")
-                    if len(parts) > 1:
-                        reminder_id = parts[-1].strip()
-            results.append({"status": "added", "id": reminder_id})
-        else:
-            results.append({"error": output, "reminder": reminder})
+    if batch:
+        # One CLI process and one store write for the whole batch
+        stdout, stderr, code = _run_reminder_cli_streams(
+            ["add-batch", "--porcelain"], input_text=json.dumps(batch)
+        )
+        # One porcelain line per batch item, in input order, on stdout only
+        # (logging goes to stderr)
+        lines = (
+            [
+                line
+                for line in stdout.splitlines()
+                if line.startswith(("ADDED ", "ERROR "))
+            ]
+            if code == 0
+            else []
+        )
+        pending = [i for i, result in enumerate(results) if result is None]
+        for position, index in enumerate(pending):
+            line = lines[position] if position < len(lines) else ""
+            if line.startswith("ADDED "):
+                reminder_id = line[6:].split(None, 1)[0]
+                results[index] = {"status": "added", "id": reminder_id}
+            else:
+                error = line[6:] if line.startswith("ERROR ") else stdout + stderr
+                results[index] = {"error": error, "reminder": reminders[index]}
 
     return {"results": results}
 
@@ -710,17 +797,23 @@ def list_reminders() -> dict:
     """List all reminders stored in the reminder daemon.
 
     Returns a list of all pending and due reminders with their details including
-    ID, title, message, due time, and current status.
+    ID, title, message, due time, related task and status ("pending" or "due").
 
     Example: {}
     """
-    output, code = _run_reminder_cli(["list"])
+    output, code = _run_reminder_cli(["list", "--json"])
     if code != 0:
         return {"error": output}
 
-    # Parse the output - for simplicity, return raw output
-    # In production, you might want to parse the table format
-    return {"output": output, "status": "success"}
+    # The JSON array is a single stdout line; stderr log lines are mixed in
+    payload = next((line for line in output.splitlines() if line.startswith("[")), None)
+    try:
+        reminders = json.loads(payload) if payload is not None else None
+    except ValueError:
+        reminders = None
+    if reminders is None:
+        return {"error": f"Unexpected reminder CLI output: {output}"}
+    return {"reminders": reminders, "count": len(reminders), "status": "success"}
 
 
 @app.tool()
@@ -764,7 +857,13 @@ def remove_reminders(
 
 def main() -> None:
     logger.info("Starting todo-list MCP server with SQLite storage")
-    _ensure_daemon_running()
+    # Probing/spawning the daemon can take a subprocess round-trip plus a
+    # startup wait; don't hold the server's first request behind it.
+    # Reminders are persisted by the CLI, so the daemon picks up any
+    # added before it is up.
+    threading.Thread(
+        target=_ensure_daemon_running, name="reminder-daemon-bootstrap", daemon=True
+    ).start()
     app.run(show_banner=False)
 
 
@@ -6,10 +6,45 @@ backward compatibility.
 """
 
 from datetime import UTC, datetime
-from typing import List, Optional
-
-from sqlalchemy import JSON, String
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from functools import lru_cache
+from typing import List, Literal, Optional, get_args
+
+from sqlalchemy import (
+    JSON,
+    CheckConstraint,
+    ForeignKey,
+    Index,
+    String,
+    case,
+    literal_column,
+    select,
+    update,
+)
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+
+def utc_now_iso() -> str:
+    """Current UTC time as an ISO 8601 string (the stored timestamp format)."""
+    return datetime.now(tz=UTC).isoformat()
+
+
+@lru_cache(maxsize=4096)
+def parse_iso(value: str) -> Optional[datetime]:
+    """Parse an ISO 8601 string as an aware UTC datetime (None if invalid)."""
+    try:
+        cleaned = value.replace("Z", "+00:00")
+        dt = datetime.fromisoformat(cleaned)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=UTC)
+        return dt.astimezone(UTC)
+    except Exception:
+        return None
+
+
+def iso_to_epoch(value: Optional[str]) -> Optional[float]:
+    """Convert an ISO 8601 string to epoch seconds (None if missing/invalid)."""
+    dt = parse_iso(value) if value else None
+    return dt.timestamp() if dt else None
 
 
 class Base(DeclarativeBase):
@@ -18,6 +53,26 @@ class Base(DeclarativeBase):
     pass
 
 
+# Allowed values for the enumerated task columns; the tool schemas use the
+# Literal types and the CHECK constraints / update validation use the tuples
+TaskStatus = Literal["open", "in-progress", "done"]
+TaskLevel = Literal["low", "medium", "high"]
+TASK_STATUSES: tuple[str, ...] = get_args(TaskStatus)
+TASK_LEVELS: tuple[str, ...] = get_args(TaskLevel)
+
+
+def _one_of(column: str, values: tuple[str, ...]) -> CheckConstraint:
+    """CHECK constraint for an enumerated column.
+
+    Only emitted by CREATE TABLE: SQLite cannot add constraints to an existing
+    table, so databases created before these constraints existed (which
+    upgrade_tables only extends with new columns and indexes) do not enforce
+    them; update_tasks validates the values in both cases.
+    """
+    allowed = ", ".join(f"'{value}'" for value in values)
+    return CheckConstraint(f"{column} IN ({allowed})", name=f"ck_tasks_{column}")
+
+
 class Task(Base):
     """Task model representing a todo item.
 
@@ -27,6 +82,13 @@ class Task(Base):
     """
 
     __tablename__ = "tasks"
+    # Enumerations are stored as plain TEXT (no per-row enum conversion on load)
+    # and constrained in SQL on databases created with these constraints
+    __table_args__ = (
+        _one_of("status", TASK_STATUSES),
+        _one_of("priority", TASK_LEVELS),
+        _one_of("urgency", TASK_LEVELS),
+    )
 
     # Primary key (auto-generated)
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -49,6 +111,8 @@ class Task(Base):
     # Time tracking
     time_estimate: Mapped[Optional[float]] = mapped_column(nullable=True)
     due_date: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
+    # Due date as epoch seconds, derived from due_date for numeric sort/filter
+    due_ts: Mapped[Optional[float]] = mapped_column(nullable=True, index=True)
 
     # Tags stored as JSON array for flexibility
     tags: Mapped[List[str]] = mapped_column(JSON, nullable=False, default=list)
@@ -56,32 +120,91 @@ class Task(Base):
     # Assignment
     assignee: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
 
-    # Timestamps (auto-managed)
-    created_at: Mapped[str] = mapped_column(
-        String, nullable=False, default=lambda: datetime.now(tz=UTC).isoformat()
-    )
+    # Timestamps (auto-managed). Kept as ISO 8601 strings, the format the
+    # tools return; updated_at is refreshed by the ORM whenever a flush
+    # actually writes the row, so no-op updates leave it untouched.
+    created_at: Mapped[str] = mapped_column(String, nullable=False, default=utc_now_iso)
     updated_at: Mapped[str] = mapped_column(
-        String, nullable=False, default=lambda: datetime.now(tz=UTC).isoformat()
+        String, nullable=False, default=utc_now_iso, onupdate=utc_now_iso
     )
 
     def __repr__(self) -> str:
         return f"Task(id={self.id}, title={self.title!r}, status={self.status!r})"
 
-    def to_dict(self) -> dict:
-        """Convert task to dictionary matching YAML structure."""
-        return {
-            "title": self.title,
-            "description": self.description,
-            "status": self.status,
-            "priority": self.priority,
-            "urgency": self.urgency,
-            "time_estimate": self.time_estimate,
-            "due_date": self.due_date,
-            "tags": self.tags or [],
-            "assignee": self.assignee,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-        }
+    def to_dict(self, include_description: bool = True) -> dict:
+        """Convert task to dictionary matching YAML structure.
+
+        With include_description=False the key is omitted and the (possibly
+        deferred) column is never touched.
+        """
+        data = {"title": self.title}
+        if include_description:
+            data["description"] = self.description
+        data.update(
+            {
+                "status": self.status,
+                "priority": self.priority,
+                "urgency": self.urgency,
+                "time_estimate": self.time_estimate,
+                "due_date": self.due_date,
+                "tags": self.tags or [],
+                "assignee": self.assignee,
+                "created_at": self.created_at,
+                "updated_at": self.updated_at,
+            }
+        )
+        return data
+
+
+# Sort rank for priorities (high first); unknown values sort last
+PRIORITY_RANK = {"high": 0, "medium": 1, "low": 2}
+
+# Rendered with inline literals (not bound parameters) so SQLite can match
+# the ORDER BY expression against the index below
+task_priority_rank = case(
+    *(
+        (Task.priority == literal_column(f"'{name}'"), literal_column(str(rank)))
+        for name, rank in PRIORITY_RANK.items()
+    ),
+    else_=literal_column(str(len(PRIORITY_RANK))),
+)
+
+# list_tasks ORDER BY: priority, then due date (tasks without a due date last).
+# Built once so the statement reuses the same clause objects on every call.
+TASK_LIST_ORDER = (
+    task_priority_rank,
+    Task.due_ts.is_(None),
+    Task.due_ts,
+    Task.id,
+)
+
+# Expression index matching the leading TASK_LIST_ORDER terms
+Index("ix_tasks_priority_rank_due_ts", *TASK_LIST_ORDER[:3])
+
+# Most listings filter by status; with status leading, a single-status listing
+# is an index range scan that already comes out in TASK_LIST_ORDER
+Index("ix_tasks_status_priority_rank_due_ts", Task.status, *TASK_LIST_ORDER[:3])
+
+
+def backfill_due_ts(session: Session) -> int:
+    """Populate due_ts for tasks stored before the column existed.
+
+    Returns the number of tasks updated; due dates that don't parse are left
+    without a due_ts.
+    """
+    # Only the two needed columns are read (no ORM entities are built),
+    # and the result is written back as one executemany UPDATE by id
+    stmt = select(Task.id, Task.due_date).where(
+        Task.due_ts.is_(None), Task.due_date.is_not(None)
+    )
+    rows = [
+        {"id": task_id, "due_ts": due_ts}
+        for task_id, due_date in session.execute(stmt)
+        if (due_ts := iso_to_epoch(due_date)) is not None
+    ]
+    if rows:
+        session.execute(update(Task), rows)
+    return len(rows)
 
 
 class Reminder(Base):
@@ -101,8 +224,11 @@ class Reminder(Base):
     message: Mapped[str] = mapped_column(String, nullable=False)
     due_at: Mapped[str] = mapped_column(String, nullable=False, index=True)
 
-    # Optional task association
-    task_id: Mapped[Optional[int]] = mapped_column(nullable=True, index=True)
+    # Optional task association. Cascades in SQL (needs PRAGMA foreign_keys=ON),
+    # since delete_tasks removes tasks with a bulk DELETE that skips ORM cascades
+    task_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("tasks.id", ondelete="CASCADE"), nullable=True, index=True
+    )
 
     # Status tracking
     status: Mapped[str] = mapped_column(
@@ -110,9 +236,7 @@ class Reminder(Base):
     )
 
     # Timestamps
-    created_at: Mapped[str] = mapped_column(
-        String, nullable=False, default=lambda: datetime.now(tz=UTC).isoformat()
-    )
+    created_at: Mapped[str] = mapped_column(String, nullable=False, default=utc_now_iso)
 
     def __repr__(self) -> str:
         return f"Reminder(id={self.id}, title={self.title!r}, due_at={self.due_at!r})"
@@ -7,13 +7,17 @@ and delivers desktop notifications when they're due.
 
 from __future__ import annotations
 
+import builtins
 import json
 import signal
 import sys
 import threading
 import time
-from dataclasses import asdict, dataclass
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Optional
 
@@ -22,6 +26,13 @@ from loguru import logger
 from rich.console import Console
 from rich.table import Table
 
+from todo_list_mcp.daemon_pid import (
+    PID_FILE,
+    is_daemon_running,
+    read_pid,
+    remove_pid_file,
+    write_pid_file,
+)
 from todo_list_mcp.logging_config import setup_logging
 from todo_list_mcp.wxpython_reminder_client import ReminderClient
 from todo_list_mcp.settings import get_settings
@@ -36,7 +47,7 @@ setup_logging(settings)
 # Constants derived from settings
 APP_DATA_DIR = Path(settings.app_data_dir)
 REMINDERS_FILE = APP_DATA_DIR / "reminder_daemon" / "reminders.json"
-PID_FILE = APP_DATA_DIR / "reminder_daemon" / "daemon.pid"
+POLL_INTERVAL = 1.0  # Max seconds between checks for externally added reminders
 console = Console()
 app = typer.Typer(help="Reminder daemon - persistent reminder service")
 
@@ -88,15 +99,30 @@ class ReminderStore:
         """Save all reminders to file."""
         with self._lock:
             try:
+                # json.dumps without indent runs entirely in the C encoder;
+                # Reminder is flat, so vars() avoids asdict()'s deep copy
+                payload = json.dumps([vars(r) for r in reminders])
                 with open(self.file_path, "w") as f:
-                    json.dump([asdict(r) for r in reminders], f, indent=2)
+                    f.write(payload)
             except Exception as e:
                 logger.error(f"Failed to save reminders: {e}")
 
+    def signature(self) -> Optional[tuple[int, int]]:
+        """Return (mtime_ns, size) of the store file, or None if it doesn't exist."""
+        try:
+            stat = self.file_path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     def add(self, reminder: Reminder) -> None:
         """Add a new reminder."""
+        self.add_many([reminder])
+
+    def add_many(self, new_reminders: List[Reminder]) -> None:
+        """Add several reminders with a single read and write of the store."""
         reminders = self.load()
-        reminders.append(reminder)
+        reminders.extend(new_reminders)
         self.save(reminders)
 
     def remove(self, reminder_ids: List[str]) -> int:
@@ -122,6 +148,11 @@ class ReminderDaemon:
         self.store = store
         self._shutdown = threading.Event()
         self._thread = threading.Thread(target=self._run, daemon=True)
+        # Delivery (popup + sound) runs off the scheduling thread so a slow
+        # dialog doesn't delay the next reminder
+        self._delivery_pool = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="reminder-delivery"
+        )
         self._reminder_client: Optional[ReminderClient] = None
         self._sound_client: Optional[SoundClient] = None
 
@@ -141,6 +172,7 @@ class ReminderDaemon:
         self._shutdown.set()
         if self._thread.is_alive():
             self._thread.join(timeout=2)
+        self._delivery_pool.shutdown(wait=True)
 
         if self._reminder_client:
             try:
@@ -154,24 +186,46 @@ class ReminderDaemon:
                 pass
 
     def _run(self) -> None:
-        """Main daemon loop."""
+        """Main daemon loop.
+
+        The store is only re-read when the file changes (reminders are added by
+        separate CLI processes) and is kept as a due-time-sorted snapshot, so a
+        tick only looks at the head of the schedule. The loop sleeps until the
+        next reminder is due, capped at POLL_INTERVAL so external changes are
+        still noticed.
+        """
+        schedule: List[tuple[float, Reminder]] = []
+        loaded_signature: Optional[tuple[int, int]] = None
         while not self._shutdown.is_set():
+            timeout = POLL_INTERVAL
             try:
-                reminders = self.store.load()
-                due_reminders = [r for r in reminders if r.is_due()]
+                signature = self.store.signature()
+                if signature != loaded_signature:
+                    schedule = _due_schedule(self.store.load())
+                    loaded_signature = signature
+
+                due_count = bisect_right(schedule, time.time(), key=itemgetter(0))
+                due_reminders = [r for _, r in schedule[:due_count]]
 
                 for reminder in due_reminders:
-                    self._deliver(reminder)
+                    self._delivery_pool.submit(self._deliver, reminder)
 
                 if due_reminders:
-                    # Remove delivered reminders
-                    remaining = [r for r in reminders if not r.is_due()]
-                    self.store.save(remaining)
-
+                    # Remove delivered reminders, keeping any added meanwhile
+                    delivered_ids = {r.id for r in due_reminders}
+                    reminders = [
+                        r for r in self.store.load() if r.id not in delivered_ids
+                    ]
+                    self.store.save(reminders)
+                    schedule = _due_schedule(reminders)
+                    loaded_signature = self.store.signature()
+
+                timeout = _seconds_until_next_due(schedule, POLL_INTERVAL)
             except Exception as e:
                 logger.error(f"Daemon error: {e}")
 
-            time.sleep(1)  # Check every second
+            # Returns early on shutdown instead of sleeping out the interval
+            self._shutdown.wait(timeout)
 
     def _deliver(self, reminder: Reminder) -> None:
         """Deliver a reminder notification."""
@@ -202,6 +256,29 @@ def _parse_iso(value: str) -> Optional[datetime]:
         return None
 
 
+def _due_schedule(reminders: List[Reminder]) -> List[tuple[float, Reminder]]:
+    """Snapshot reminders as (due epoch seconds, reminder) pairs, earliest first.
+
+    Reminders with an unparseable due_at are never due and are left out.
+    """
+    schedule: List[tuple[float, Reminder]] = []
+    for reminder in reminders:
+        due_dt = _parse_iso(reminder.due_at)
+        if due_dt is not None:
+            schedule.append((due_dt.timestamp(), reminder))
+    schedule.sort(key=itemgetter(0))
+    return schedule
+
+
+def _seconds_until_next_due(
+    schedule: List[tuple[float, Reminder]], cap: float
+) -> float:
+    """Seconds until the head of the schedule is due, clamped to [0, cap]."""
+    if not schedule:
+        return cap
+    return max(0.0, min(cap, schedule[0][0] - time.time()))
+
+
 def _now_iso() -> str:
     """Get current time as ISO 8601 string."""
     return datetime.now(tz=UTC).isoformat()
@@ -214,47 +291,6 @@ def _generate_id() -> str:
     return uuid.uuid4().hex[:8]
 
 
-def _is_daemon_running() -> bool:
-    """Check if daemon is already running by checking PID file and process."""
-    import os
-
-    if not PID_FILE.exists():
-        return False
-
-    try:
-        with open(PID_FILE, "r") as f:
-            pid = int(f.read().strip())
-
-        # Check if process with this PID exists
-        try:
-            os.kill(pid, 0)  # Signal 0 just checks if process exists
-            return True
-        except OSError:
-            # Process doesn't exist, remove stale PID file
-            PID_FILE.unlink()
-            return False
-    except (ValueError, IOError):
-        return False
-
-
-def _write_pid_file() -> None:
-    """Write current process PID to file."""
-    import os
-
-    PID_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(PID_FILE, "w") as f:
-        f.write(str(os.getpid()))
-
-
-def _remove_pid_file() -> None:
-    """Remove PID file on shutdown."""
-    try:
-        if PID_FILE.exists():
-            PID_FILE.unlink()
-    except Exception:
-        pass
-
-
 # CLI Commands
 @app.command()
 def add(
@@ -264,6 +300,9 @@ def add(
     task_filename: Optional[str] = typer.Option(
         None, "--task", "-t", help="Related task filename"
     ),
+    porcelain: bool = typer.Option(
+        False, "--porcelain", help="Print only 'ADDED <id>' (for scripts)"
+    ),
 ) -> None:
     """Add a new reminder."""
     # Validate due_at format
@@ -272,7 +311,7 @@ def add(
         console.print("[red]Error: Invalid timestamp format. Use ISO 8601.[/red]")
         raise typer.Exit(code=1)
 
-    if due_dt < datetime.now(tz=UTC):
+    if due_dt < datetime.now(tz=UTC) and not porcelain:
         console.print("[yellow]Warning: Reminder is in the past.[/yellow]")
 
     store = ReminderStore()
@@ -285,15 +324,86 @@ def add(
         task_filename=task_filename,
     )
     store.add(reminder)
-    console.print(f"[green]✓[/green] Reminder added: {reminder.id}")
+    if porcelain:
+        typer.echo(f"ADDED {reminder.id}")
+    else:
+        console.print(f"[green]✓[/green] Reminder added: {reminder.id}")
 
 
 @app.command()
-def list() -> None:
+def add_batch(
+    porcelain: bool = typer.Option(
+        False, "--porcelain", help="Print 'ADDED <id>' or 'ERROR <reason>' per item"
+    ),
+) -> None:
+    """Add reminders from a JSON array on stdin in one store write.
+
+    Each item needs title, message and due_at; task_filename is optional.
+    """
+    try:
+        items = json.load(sys.stdin)
+    except ValueError as e:
+        console.print(f"[red]Error: Invalid input: {e}[/red]")
+        raise typer.Exit(code=1)
+    # `list` is shadowed by the list command below
+    if not isinstance(items, builtins.list):
+        console.print("[red]Error: Invalid input: expected a JSON array[/red]")
+        raise typer.Exit(code=1)
+
+    created_at = _now_iso()
+    reminders: List[Reminder] = []
+    lines: List[str] = []
+    for item in items:
+        due_at = item.get("due_at", "") if isinstance(item, dict) else ""
+        if _parse_iso(due_at) is None:
+            lines.append("ERROR invalid due_at timestamp (use ISO 8601)")
+            continue
+        reminder = Reminder(
+            id=_generate_id(),
+            title=item.get("title", "Reminder"),
+            message=item.get("message", ""),
+            due_at=due_at,
+            created_at=created_at,
+            task_filename=item.get("task_filename"),
+        )
+        reminders.append(reminder)
+        lines.append(f"ADDED {reminder.id}")
+
+    # Leave the store untouched (and the daemon without a reload) if nothing
+    # was valid
+    if reminders:
+        ReminderStore().add_many(reminders)
+    if porcelain:
+        for line in lines:
+            typer.echo(line)
+    else:
+        console.print(f"[green]✓[/green] Added {len(reminders)} reminder(s)")
+        for line in lines:
+            if line.startswith("ERROR "):
+                console.print(f"[red]{line[6:]}[/red]")
+
+
+@app.command()
+def list(
+    as_json: bool = typer.Option(
+        False, "--json", help="Print reminders as a JSON array (with status)"
+    ),
+) -> None:
     """List all reminders."""
     store = ReminderStore()
     reminders = store.load()
 
+    if as_json:
+        typer.echo(
+            json.dumps(
+                [
+                    {**vars(r), "status": "due" if r.is_due() else "pending"}
+                    for r in reminders
+                ]
+            )
+        )
+        return
+
     if not reminders:
         console.print("[dim]No reminders found.[/dim]")
         return
@@ -346,13 +456,8 @@ def remove(
 @app.command()
 def status() -> None:
     """Check if the daemon is running."""
-    if _is_daemon_running():
-        try:
-            with open(PID_FILE, "r") as f:
-                pid = f.read().strip()
-            console.print(f"[green]✓[/green] Daemon is running (PID: {pid})")
-        except Exception:
-            console.print("[green]✓[/green] Daemon is running")
+    if is_daemon_running():
+        console.print(f"[green]✓[/green] Daemon is running (PID: {read_pid()})")
     else:
         console.print("[red]✗[/red] Daemon is not running")
         raise typer.Exit(code=1)
@@ -365,7 +470,7 @@ def daemon() -> None:
     import os
     
     # Check if daemon is already running
-    if _is_daemon_running():
+    if is_daemon_running():
         console.print("[yellow]Daemon is already running![/yellow]")
         console.print(f"[dim]PID file: {PID_FILE}[/dim]")
         raise typer.Exit(code=1)
@@ -374,7 +479,7 @@ def daemon() -> None:
     console.print("[dim]Press Ctrl+C to stop[/dim]")
 
     # Write PID file
-    _write_pid_file()
+    write_pid_file()
 
     store = ReminderStore()
     daemon_instance = ReminderDaemon(store)
@@ -383,7 +488,7 @@ def daemon() -> None:
     def signal_handler(sig, frame):
         console.print("\n[yellow]Shutting down...[/yellow]")
         daemon_instance.stop()
-        _remove_pid_file()
+        remove_pid_file()
         sys.exit(0)
 
     signal.signal(signal.SIGINT, signal_handler)
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic import Field
@@ -49,6 +50,11 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Retrieve application settings."""
+    """Retrieve application settings.
+
+    The instance is built once per process; call ``get_settings.cache_clear()``
+    to pick up changed environment variables (e.g. in tests).
+    """
     return Settings()
@@ -15,17 +15,23 @@ import sys
 import threading
 import time
 import uuid
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
 from loguru import logger
 
+# Finished sounds kept for inspection; older ones are forgotten so a
+# long-running process playing one-shot sounds doesn't grow without bound
+MAX_INACTIVE_SOUNDS = 100
+
 WorkerRequest = tuple[
     Callable[..., object],
     tuple[object, ...],
     dict[str, object],
-    queue.Queue[tuple[bool, object]],
+    Future[object],
 ]
 
 
@@ -219,13 +225,12 @@ class SoundClient:
         func: Callable[..., object],
         args: tuple[object, ...],
         kwargs: dict[str, object],
-        response_q: queue.Queue[tuple[bool, object]],
+        future: Future[object],
     ) -> None:
         try:
-            result = func(*args, **kwargs)
-            response_q.put((True, result))
+            future.set_result(func(*args, **kwargs))
         except Exception as exc:  # pragma: no cover - surfaced to caller
-            response_q.put((False, exc))
+            future.set_exception(exc)
 
     def _call_worker(
         self,
@@ -236,15 +241,13 @@ class SoundClient:
     ) -> Any:
         if self._shutdown_event.is_set() and not allow_after_shutdown:
             raise RuntimeError("Sound client is shut down")
-        response_q: queue.Queue[tuple[bool, object]] = queue.Queue()
-        self._queue.put((func, args, kwargs, response_q))
+        # A Future carries the result back without a per-call response queue
+        future: Future[object] = Future()
+        self._queue.put((func, args, kwargs, future))
         try:
-            success, payload = response_q.get(timeout=5)
-        except queue.Empty as exc:
+            return future.result(timeout=5)
+        except FutureTimeoutError as exc:
             raise RuntimeError("Sound worker unresponsive") from exc
-        if success:
-            return payload
-        raise payload
 
     def _add_sound(self, sound: Sound) -> None:
         self._mark_active(sound)
@@ -294,6 +297,13 @@ class SoundClient:
             raise KeyError(f"Unknown sound: {sound_id}")
         sound.active = False
         self._stop_playbacks(sound_id)
+        self._prune_inactive_sounds()
+
+    def _prune_inactive_sounds(self) -> None:
+        inactive = [sid for sid, s in self._sounds.items() if not s.active]
+        # Dicts preserve insertion order, so the oldest sounds come first
+        for sound_id in inactive[: max(0, len(inactive) - MAX_INACTIVE_SOUNDS)]:
+            del self._sounds[sound_id]
 
     def _snapshot_sounds(self) -> List[dict]:
         now = time.time()
@@ -356,6 +366,7 @@ class SoundClient:
 
     def _tick_sounds(self) -> None:
         now = time.time()
+        finished = False
         for sound in self._sounds.values():
             if not sound.active:
                 continue
@@ -366,6 +377,9 @@ class SoundClient:
                     sound.updated_at = now
                 else:
                     sound.active = False
+                    finished = True
+        if finished:
+            self._prune_inactive_sounds()
 
     def _start_playback(self, sound: Sound) -> None:
         thread = threading.Thread(target=self._play_sound, args=(sound,), daemon=True)
@@ -8,10 +8,20 @@ and common database operations with ORM models.
 
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Optional, Sequence, Type, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+)
 
 from loguru import logger
-from sqlalchemy import Engine, create_engine, inspect, select
+from sqlalchemy import Engine, create_engine, event, insert, inspect, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -19,6 +29,18 @@ from sqlalchemy.pool import StaticPool
 # Type variable for ORM models
 T = TypeVar("T", bound=DeclarativeBase)
 
+# Applied to every new file-backed connection. WAL lets readers proceed while
+# a write is in progress and, with synchronous=NORMAL, fsyncs only at
+# checkpoints; busy_timeout makes concurrent writers wait instead of failing.
+SQLITE_PRAGMAS: Dict[str, Any] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 30000,
+    "temp_store": "MEMORY",
+    "cache_size": -64000,  # KiB when negative (~64 MB)
+    "foreign_keys": "ON",
+}
+
 
 class SQLiteClientError(Exception):
     """Base exception for SQLite client errors."""
@@ -54,8 +76,12 @@ class SQLiteClient:
     Args:
         database_url: SQLite database URL (e.g., "sqlite:///path/to/db.sqlite")
         connect_args: Additional connection arguments (default: check_same_thread=False)
-        pool_class: SQLAlchemy pool class (default: StaticPool for SQLite)
+        pool_class: SQLAlchemy pool class (default: StaticPool for in-memory
+            databases, SQLAlchemy's QueuePool for database files)
         echo: Enable SQL query logging (default: False)
+        json_serializer: Callable used to encode JSON columns (default: json.dumps)
+
+    Sessions are created with ``autoflush=False`` and ``expire_on_commit=False``.
 
     Example:
         >>> from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
@@ -75,14 +101,19 @@ class SQLiteClient:
         self,
         database_url: str,
         connect_args: Optional[Dict[str, Any]] = None,
-        pool_class: Optional[type] = StaticPool,
+        pool_class: Optional[type] = None,
         echo: bool = False,
+        json_serializer: Optional[Callable[[Any], str]] = None,
     ):
         """Initialize SQLite client with connection parameters."""
         self.database_url = database_url
         self._connect_args = connect_args or {"check_same_thread": False}
+        if pool_class is None and self.is_memory:
+            # Every in-memory connection is a separate database; share one
+            pool_class = StaticPool
         self._pool_class = pool_class
         self._echo = echo
+        self._json_serializer = json_serializer
         self._engine: Optional[Engine] = None
         self._session_factory: Optional[sessionmaker] = None
 
@@ -98,24 +129,81 @@ class SQLiteClient:
         if self._engine is None:
             try:
                 logger.debug("Creating SQLAlchemy engine")
+                engine_kwargs: Dict[str, Any] = {}
+                if self._json_serializer is not None:
+                    engine_kwargs["json_serializer"] = self._json_serializer
                 self._engine = create_engine(
                     self.database_url,
                     connect_args=self._connect_args,
                     poolclass=self._pool_class,
                     echo=self._echo,
+                    **engine_kwargs,
                 )
+                if not self.is_memory:
+                    event.listen(self._engine, "connect", self._apply_pragmas)
+                event.listen(self._engine, "connect", self._disable_driver_begin)
+                # Returning an AUTOCOMMIT connection to the pool restores the
+                # driver's default isolation, so re-apply on every checkout
+                event.listen(self._engine, "checkout", self._disable_driver_begin)
+                event.listen(self._engine, "begin", self._begin)
                 logger.info("SQLite engine created successfully", url=self.database_url)
             except SQLAlchemyError as e:
                 logger.error("Failed to create SQLite engine", error=str(e))
                 raise SQLiteConnectionError(f"Failed to create engine: {e}") from e
         return self._engine
 
+    @property
+    def is_memory(self) -> bool:
+        """Whether the URL points at an in-memory database."""
+        return self.database_url in ("sqlite://", "sqlite:///:memory:") or (
+            "mode=memory" in self.database_url
+        )
+
+    @staticmethod
+    def _apply_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+        """Configure a freshly opened DBAPI connection (engine "connect" event)."""
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in SQLITE_PRAGMAS.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _disable_driver_begin(dbapi_connection: Any, *_: Any) -> None:
+        """Stop pysqlite from issuing its own BEGIN so _begin() controls it."""
+        dbapi_connection.isolation_level = None
+
+    @staticmethod
+    def _begin(connection: Any) -> None:
+        """Emit BEGIN, or BEGIN IMMEDIATE for connections opened by transaction().
+
+        A deferred transaction only takes the write lock at its first write,
+        which can fail with SQLITE_BUSY when another writer got there first.
+        IMMEDIATE takes the lock up front, so contention is absorbed by
+        busy_timeout instead of aborting part-way through.
+        """
+        options = connection.get_execution_options()
+        if options.get("isolation_level") == "AUTOCOMMIT":
+            # e.g. vacuum(): statements that must run outside a transaction
+            return
+        mode = options.get("sqlite_begin")
+        connection.exec_driver_sql(f"BEGIN {mode}" if mode else "BEGIN")
+
+    @property
+    def _write_engine(self) -> Engine:
+        """The engine with BEGIN IMMEDIATE transactions, for schema changes."""
+        return self.engine.execution_options(sqlite_begin="IMMEDIATE")
+
     @property
     def session_factory(self) -> sessionmaker:
         """Get or create session factory with lazy initialization."""
         if self._session_factory is None:
+            # Sessions are short-lived: nothing is re-SELECTed after commit and
+            # queries never trigger an implicit flush (call session.flush()
+            # to make pending changes visible to a query in the same session)
             self._session_factory = sessionmaker(
-                bind=self.engine, expire_on_commit=False
+                bind=self.engine, autoflush=False, expire_on_commit=False
             )
             logger.debug("Session factory created")
         return self._session_factory
@@ -188,12 +276,14 @@ class SQLiteClient:
         with self.session() as session:
             try:
                 logger.debug("Transaction started")
-                yield session
-                session.commit()
+                # Session.begin() commits on success and rolls back on error,
+                # releasing the pooled connection as soon as the block ends
+                with session.begin():
+                    session.connection(execution_options={"sqlite_begin": "IMMEDIATE"})
+                    yield session
                 logger.debug("Transaction committed")
             except Exception as e:
-                logger.error("Transaction failed, rolling back", error=str(e))
-                session.rollback()
+                logger.error("Transaction failed, rolled back", error=str(e))
                 raise SQLiteTransactionError(f"Transaction failed: {e}") from e
 
     def create_tables(self, base: Type[DeclarativeBase]) -> None:
@@ -213,12 +303,74 @@ class SQLiteClient:
         """
         try:
             logger.info("Creating database tables")
-            base.metadata.create_all(self.engine)
+            base.metadata.create_all(self._write_engine)
             logger.info("Database tables created successfully")
         except SQLAlchemyError as e:
             logger.error("Table creation failed", error=str(e))
             raise SQLiteConnectionError(f"Table creation failed: {e}") from e
 
+    def upgrade_tables(self, base: Type[DeclarativeBase]) -> List[str]:
+        """
+        Add columns and indexes declared on models but missing from existing tables.
+
+        ``create_all`` never alters tables that already exist, so databases created
+        by older versions would lack newly added columns. Only additive changes are
+        applied; new columns must be nullable.
+
+        Args:
+            base: SQLAlchemy DeclarativeBase class with table definitions
+
+        Returns:
+            List of added columns as "table.column" strings
+
+        Raises:
+            SQLiteConnectionError: If schema upgrade fails
+
+        Example:
+            >>> client.create_tables(Base)
+            >>> client.upgrade_tables(Base)
+        """
+        added: List[str] = []
+        try:
+            # Inspect inside the write transaction so the schema cannot change
+            # between the check and the ALTER (e.g. another process upgrading)
+            with self._write_engine.begin() as conn:
+                inspector = inspect(conn)
+                for table in base.metadata.sorted_tables:
+                    if not inspector.has_table(table.name):
+                        continue
+                    existing = {
+                        col["name"] for col in inspector.get_columns(table.name)
+                    }
+                    for column in table.columns:
+                        if column.name in existing:
+                            continue
+                        column_type = column.type.compile(dialect=self.engine.dialect)
+                        conn.exec_driver_sql(
+                            f'ALTER TABLE "{table.name}" '
+                            f'ADD COLUMN "{column.name}" {column_type}'
+                        )
+                        added.append(f"{table.name}.{column.name}")
+                    # Query sqlite_master directly: the inspector skips
+                    # expression-based indexes
+                    existing_indexes = {
+                        row[0]
+                        for row in conn.exec_driver_sql(
+                            "SELECT name FROM sqlite_master "
+                            "WHERE type = 'index' AND tbl_name = ?",
+                            (table.name,),
+                        )
+                    }
+                    for index in table.indexes:
+                        if index.name not in existing_indexes:
+                            index.create(conn)
+            if added:
+                logger.info("Database tables upgraded", added_columns=added)
+            return added
+        except SQLAlchemyError as e:
+            logger.error("Table upgrade failed", error=str(e))
+            raise SQLiteConnectionError(f"Table upgrade failed: {e}") from e
+
     def drop_tables(self, base: Type[DeclarativeBase]) -> None:
         """
         Drop all tables defined in the declarative base.
@@ -234,7 +386,7 @@ class SQLiteClient:
         """
         try:
             logger.warning("Dropping database tables")
-            base.metadata.drop_all(self.engine)
+            base.metadata.drop_all(self._write_engine)
             logger.info("Database tables dropped successfully")
         except SQLAlchemyError as e:
             logger.error("Table dropping failed", error=str(e))
@@ -296,6 +448,44 @@ class SQLiteClient:
             logger.error("Batch add operation failed", error=str(e))
             raise SQLiteQueryError(f"Batch add operation failed: {e}") from e
 
+    def insert_many(
+        self, session: Session, model: Type[T], rows: Sequence[Dict[str, Any]]
+    ) -> List[Any]:
+        """
+        Insert rows with a single bulk INSERT ... RETURNING statement.
+
+        Skips ORM unit-of-work bookkeeping (no instances are created), so it is
+        much cheaper than ``add_all`` for large batches. Column defaults declared
+        on the model are still applied.
+
+        Args:
+            session: Active database session
+            model: ORM model class (must have a single-column primary key)
+            rows: Column values for each row to insert
+
+        Returns:
+            Primary keys of the inserted rows, in the order of ``rows``
+
+        Raises:
+            SQLiteQueryError: If the insert fails
+
+        Example:
+            >>> with client.transaction() as session:
+            ...     ids = client.insert_many(session, User, [{"name": "Alice"}])
+        """
+        if not rows:
+            return []
+        try:
+            logger.debug("Bulk inserting rows", model=model.__name__, count=len(rows))
+            (pk_column,) = inspect(model).primary_key
+            stmt = insert(model).returning(pk_column, sort_by_parameter_order=True)
+            ids = list(session.scalars(stmt, rows))
+            logger.debug("Bulk insert completed", count=len(ids))
+            return ids
+        except SQLAlchemyError as e:
+            logger.error("Bulk insert failed", error=str(e))
+            raise SQLiteQueryError(f"Bulk insert failed: {e}") from e
+
     def get_by_id(self, session: Session, model: Type[T], id_value: Any) -> Optional[T]:
         """
         Get a model instance by its primary key.
@@ -326,6 +516,45 @@ class SQLiteClient:
             logger.error("Get by ID failed", error=str(e))
             raise SQLiteQueryError(f"Get by ID failed: {e}") from e
 
+    def get_by_ids(
+        self, session: Session, model: Type[T], id_values: Sequence[Any]
+    ) -> Dict[Any, T]:
+        """
+        Get model instances for many primary keys with a single query.
+
+        Args:
+            session: Active database session
+            model: ORM model class (must have a single-column primary key)
+            id_values: Primary key values; duplicates and missing keys are allowed
+
+        Returns:
+            Mapping of primary key to instance for the keys that exist
+
+        Raises:
+            SQLiteQueryError: If query fails
+
+        Example:
+            >>> with client.session() as session:
+            ...     users = client.get_by_ids(session, User, [1, 2, 3])
+            ...     alice = users.get(1)
+        """
+        if not id_values:
+            return {}
+        try:
+            logger.debug("Fetching by IDs", model=model.__name__, count=len(id_values))
+            mapper = inspect(model)
+            (pk_column,) = mapper.primary_key
+            stmt = select(model).where(pk_column.in_(set(id_values)))
+            instances = {
+                mapper.primary_key_from_instance(instance)[0]: instance
+                for instance in session.scalars(stmt)
+            }
+            logger.debug("Fetch by IDs completed", found=len(instances))
+            return instances
+        except SQLAlchemyError as e:
+            logger.error("Get by IDs failed", error=str(e))
+            raise SQLiteQueryError(f"Get by IDs failed: {e}") from e
+
     def query(self, session: Session, model: Type[T]) -> Any:
         """
         Create a query for a model.
@@ -444,9 +673,12 @@ class SQLiteClient:
         """
         try:
             logger.info("Running VACUUM command")
-            with self.engine.connect() as conn:
+            # VACUUM cannot run inside a transaction, so no BEGIN is emitted
+            autocommit_engine = self.engine.execution_options(
+                isolation_level="AUTOCOMMIT"
+            )
+            with autocommit_engine.connect() as conn:
                 conn.exec_driver_sql("VACUUM")
-                conn.commit()
             logger.info("VACUUM completed successfully")
         except SQLAlchemyError as e:
             logger.error("VACUUM failed", error=str(e))
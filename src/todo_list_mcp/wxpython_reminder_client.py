@@ -9,6 +9,7 @@ import queue
 import threading
 import time
 import uuid
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from typing import Callable, Dict, List, Optional
 
@@ -36,9 +37,7 @@ class Reminder:
 class ReminderClient:
     def __init__(self, poll_interval_ms: int = 80) -> None:
         self._poll_interval_ms = max(16, poll_interval_ms)
-        self._queue: "queue.Queue[tuple[Callable, tuple, dict, queue.Queue]]" = (
-            queue.Queue()
-        )
+        self._queue: "queue.Queue[tuple[Callable, tuple, dict, Future]]" = queue.Queue()
         self._shutdown_event = threading.Event()
         self._ready = threading.Event()
         self._reminders: Dict[str, Reminder] = {}
@@ -242,12 +241,11 @@ class ReminderClient:
     def _process_queue(self) -> None:
         while True:
             try:
-                func, args, kwargs, response_q = self._queue.get_nowait()
+                func, args, kwargs, future = self._queue.get_nowait()
             except queue.Empty:
                 break
             try:
-                result = func(*args, **kwargs)
-                response_q.put((True, result))
+                future.set_result(func(*args, **kwargs))
             except Exception as exc:  # pragma: no cover - surfaced to caller
                 logger.error(
                     "Reminder UI task failed",
@@ -257,7 +255,7 @@ class ReminderClient:
                         "func": getattr(func, "__name__", str(func)),
                     },
                 )
-                response_q.put((False, exc))
+                future.set_exception(exc)
         if self._shutdown_event.is_set():
             # Exit the wx MainLoop
             self._app.ExitMainLoop()
@@ -265,12 +263,9 @@ class ReminderClient:
     def _call_ui(self, func: Callable, *args, **kwargs):
         if self._shutdown_event.is_set():
             raise RuntimeError("Reminder client is shut down")
-        response_q: "queue.Queue[tuple[bool, object]]" = queue.Queue()
-        self._queue.put((func, args, kwargs, response_q))
-        success, payload = response_q.get()
-        if success:
-            return payload
-        raise payload
+        future: Future = Future()
+        self._queue.put((func, args, kwargs, future))
+        return future.result()
 
     def _create_reminder_ui(
         self,
@@ -6,24 +6,44 @@ to a running MCP server and calling its tools.
 """
 
 import asyncio
-from typing import Any, Dict, List
+import threading
+from typing import Any, Coroutine, Dict, List, Sequence, Tuple, TypeVar
 
 from fastmcp import Client
-from fastmcp.client.transports import StdioTransport
+from fastmcp.client.transports import FastMCPTransport, StdioTransport
+
+T = TypeVar("T")
 
 
 class MCPClient:
     """Simple MCP client for testing purposes."""
 
-    def __init__(self, server_path: str, env: Dict[str, str] | None = None):
+    def __init__(
+        self,
+        server_path: str,
+        env: Dict[str, str] | None = None,
+        in_process: bool = False,
+    ):
         """Initialize the MCP client.
 
         Args:
             server_path: Path to the MCP server script (not used, kept for compatibility)
             env: Environment variables to pass to the server
+            in_process: Talk to the server app imported into this process instead
+                of spawning it and speaking JSON-RPC over stdio
         """
         self.server_path = server_path
         self.env = env or {}
+        # Tool list is static for the lifetime of a connection
+        self._tools_cache: List[Dict] | None = None
+        if in_process:
+            # Imported lazily: importing the server opens its database
+            from todo_list_mcp.mcp_server import app
+
+            self.transport = FastMCPTransport(app)
+            self.client = Client(self.transport)
+            return
+
         # Create transport with environment variables
         # Run as module from the project root
         import pathlib
@@ -33,7 +53,9 @@ class MCPClient:
         )  # Go up to project root
         self.transport = StdioTransport(
             command="uv",
-            args=["run", "todo-list-mcp"],
+            # The environment is synced once by whatever launched pytest;
+            # skip uv's lockfile check on server spawn
+            args=["run", "--no-sync", "todo-list-mcp"],
             env=self.env,
             cwd=str(project_root),
         )
@@ -46,6 +68,7 @@ class MCPClient:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Exit context manager and disconnect."""
+        self._tools_cache = None
         await self.client.__aexit__(exc_type, exc_val, exc_tb)
 
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
@@ -61,69 +84,127 @@ class MCPClient:
         result = await self.client.call_tool(tool_name, arguments)
         return result
 
+    async def call_tools(
+        self, calls: Sequence[Tuple[str, Dict[str, Any]]]
+    ) -> List[Any]:
+        """Call several independent tools concurrently over the one connection.
+
+        Requests are pipelined on the transport rather than awaited one by one.
+        Only use this for calls that do not depend on each other's results.
+
+        Args:
+            calls: (tool_name, arguments) pairs
+
+        Returns:
+            Tool execution results, in the order of ``calls``
+        """
+        return list(
+            await asyncio.gather(
+                *(self.client.call_tool(name, arguments) for name, arguments in calls)
+            )
+        )
+
     async def list_tools(self) -> List[Dict]:
         """List all available tools from the server.
 
+        The result is fetched and converted once per connection.
+
         Returns:
             List of tool descriptions
         """
-        tools = await self.client.list_tools()
-        # Convert Tool objects to dictionaries
-        return [tool.model_dump() for tool in tools]
+        if self._tools_cache is None:
+            tools = await self.client.list_tools()
+            # Convert Tool objects to dictionaries
+            self._tools_cache = [tool.model_dump() for tool in tools]
+        return self._tools_cache
 
 
 # Synchronous wrapper for easier testing
 class SyncMCPClient:
-    """Synchronous wrapper around the async MCP client."""
-
-    def __init__(self, server_path: str, env: Dict[str, str] | None = None):
+    """Synchronous wrapper around the async MCP client.
+
+    The client's event loop runs on a dedicated background thread, so the
+    transport keeps being serviced between calls and calls may be issued from
+    any thread (they are submitted with ``run_coroutine_threadsafe``).
+    """
+
+    def __init__(
+        self,
+        server_path: str,
+        env: Dict[str, str] | None = None,
+        in_process: bool = False,
+    ):
         """Initialize the synchronous MCP client."""
         self.server_path = server_path
         self.env = env or {}
-        self._loop = None
+        self.in_process = in_process
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
         self._async_client = None
 
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the client loop and wait for its result."""
+        if not self._loop:
+            raise RuntimeError("Client not connected")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
     def __enter__(self):
         """Enter context manager."""
         self._loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self._loop)
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="mcp-client-loop", daemon=True
+        )
+        self._thread.start()
 
         # Create async client
-        self._async_client = MCPClient(self.server_path, self.env)
+        self._async_client = MCPClient(self.server_path, self.env, self.in_process)
 
         # Enter the async context
-        self._loop.run_until_complete(self._async_client.__aenter__())
+        try:
+            self._run(self._async_client.__aenter__())
+        except BaseException:
+            self._shutdown_loop()
+            raise
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Exit context manager."""
-        if self._async_client:
-            self._loop.run_until_complete(
-                self._async_client.__aexit__(exc_type, exc_val, exc_tb)
-            )
-            # Properly stop the transport to prevent cleanup warnings
-            if hasattr(self._async_client.transport, "_stop_event"):
-                self._async_client.transport._stop_event.set()
-
+        """Exit context manager. Safe to call more than once."""
+        async_client, self._async_client = self._async_client, None
+        try:
+            if async_client and self._loop:
+                self._run(async_client.__aexit__(exc_type, exc_val, exc_tb))
+                # Properly stop the transport to prevent cleanup warnings
+                if hasattr(async_client.transport, "_stop_event"):
+                    async_client.transport._stop_event.set()
+        finally:
+            self._shutdown_loop()
+
+    def _shutdown_loop(self) -> None:
+        """Stop the loop thread and close the loop."""
         if self._loop:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            if self._thread:
+                self._thread.join()
             self._loop.close()
+        self._loop = None
+        self._thread = None
 
     def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
         """Call an MCP tool synchronously."""
         if not self._loop or not self._async_client:
             raise RuntimeError("Client not connected")
+        return self._run(self._async_client.call_tool(tool_name, arguments))
 
-        async def _call():
-            return await self._async_client.call_tool(tool_name, arguments)
-
-        return self._loop.run_until_complete(_call())
+    def call_tools_batch(
+        self, calls: Sequence[Tuple[str, Dict[str, Any]]]
+    ) -> List[Any]:
+        """Call several independent tools concurrently; results keep input order."""
+        if not self._loop or not self._async_client:
+            raise RuntimeError("Client not connected")
+        return self._run(self._async_client.call_tools(calls))
 
     def list_tools(self) -> List[Dict]:
         """List tools synchronously."""
         if not self._loop or not self._async_client:
             raise RuntimeError("Client not connected")
-
-        async def _list():
-            return await self._async_client.list_tools()
-
-        return self._loop.run_until_complete(_list())
+        return self._run(self._async_client.list_tools())
@@ -0,0 +1,32 @@
+"""Shared pytest fixtures."""
+
+import os
+
+import pytest
+from dotenv import load_dotenv
+
+from tests.client import SyncMCPClient
+
+
+@pytest.fixture(scope="session")
+def mcp_client():
+    """Starts the MCP server once per test session using current environment.
+
+    Every test module shares the one server (the app imported in-process, or a
+    subprocess with ``E2E_TRANSPORT=stdio``). Under pytest-xdist
+    (``uv run pytest -n auto``) each worker is its own session, so this is one
+    server per worker; the workers share one database, and tests only assert
+    on the tasks they created.
+    """
+
+    # Load .env file if it exists
+    load_dotenv()
+
+    server_path = os.path.abspath(__file__)
+    # In-process by default; E2E_TRANSPORT=stdio spawns the server via
+    # `uv run todo-list-mcp` to exercise the real stdio JSON-RPC transport
+    in_process = os.environ.get("E2E_TRANSPORT", "in-process") != "stdio"
+    with SyncMCPClient(
+        server_path, env=dict(os.environ), in_process=in_process
+    ) as client:
+        yield client
@@ -0,0 +1,68 @@
+"""Tests for the reminder daemon PID file helpers."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from todo_list_mcp import daemon_pid
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="the PID probe is disabled on Windows"
+)
+
+
+@pytest.fixture()
+def pid_file(tmp_path: Path) -> Path:
+    return tmp_path / "reminder_daemon" / "daemon.pid"
+
+
+def _kill_raising(exc: type[OSError]):
+    def kill(pid: int, sig: int) -> None:
+        raise exc()
+
+    return kill
+
+
+def test_missing_pid_file_is_not_running(pid_file: Path) -> None:
+    assert daemon_pid.is_daemon_running(pid_file) is False
+
+
+@pytest.mark.parametrize("content", ["not-a-pid", "0", "-1"])
+def test_malformed_pid_file_is_not_running(pid_file: Path, content: str) -> None:
+    pid_file.parent.mkdir(parents=True)
+    pid_file.write_text(content)
+    assert daemon_pid.is_daemon_running(pid_file) is False
+
+
+def test_written_pid_is_running(pid_file: Path) -> None:
+    daemon_pid.write_pid_file(pid_file)
+
+    assert daemon_pid.read_pid(pid_file) == os.getpid()
+    assert daemon_pid.is_daemon_running(pid_file) is True
+
+    daemon_pid.remove_pid_file(pid_file)
+    assert not pid_file.exists()
+
+
+def test_exited_process_is_not_running_and_pid_file_removed(
+    pid_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    daemon_pid.write_pid_file(pid_file)
+    monkeypatch.setattr(daemon_pid.os, "kill", _kill_raising(ProcessLookupError))
+
+    assert daemon_pid.is_daemon_running(pid_file) is False
+    assert not pid_file.exists()
+
+
+def test_process_of_another_user_is_running(
+    pid_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    daemon_pid.write_pid_file(pid_file)
+    monkeypatch.setattr(daemon_pid.os, "kill", _kill_raising(PermissionError))
+
+    assert daemon_pid.is_daemon_running(pid_file) is True
+    assert pid_file.exists()
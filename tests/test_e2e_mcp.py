@@ -8,70 +8,126 @@ the environment or .env; no skipping based on env checks here.
 
 from __future__ import annotations
 
+import itertools
 import json
-import os
 import uuid
 from datetime import UTC, datetime, timedelta
+from typing import Any
 
 import pytest
-from dotenv import load_dotenv
+from fastmcp.client.client import CallToolResult
 from fastmcp.exceptions import ToolError
+from mcp.types import TextContent
 
 from tests.client import SyncMCPClient
 
 pytestmark = pytest.mark.e2e
 
 
-@pytest.fixture(scope="module")
-def mcp_client():
-    """Starts the MCP server via SyncMCPClient using current environment."""
+# Names must not repeat across runs (the database persists between them), so
+# one random run id is drawn at import and a counter makes names unique within
+# the run (and within each pytest-xdist worker, which imports its own copy)
+_RUN_ID = uuid.uuid4().hex[:8]
+_COUNTER = itertools.count()
 
-    # Load .env file if it exists
-    load_dotenv()
 
-    server_path = os.path.abspath(__file__)
-    with SyncMCPClient(server_path, env=dict(os.environ)) as client:
-        yield client
+def _unique_name(prefix: str = "e2e") -> str:
+    return f"{prefix}-{_RUN_ID}-{next(_COUNTER):04x}"
 
 
 @pytest.fixture()
 def unique_task_name() -> str:
-    return f"e2e-{uuid.uuid4().hex[:8]}.yaml"
+    return f"{_unique_name()}.yaml"
+
+
+# Two days ahead is far enough that a test run never crosses it, so the due
+# date is computed once at import rather than per payload
+_DUE_IN_TWO_DAYS = (datetime.now(tz=UTC) + timedelta(days=2)).isoformat()
+
+_PAYLOAD_TEMPLATE = {
+    "description": "happy path",
+    "status": "open",
+    "priority": "medium",
+    "urgency": "medium",
+    "time_estimate": 2.5,
+    "assignee": "bot",
+    "due_date": _DUE_IN_TWO_DAYS,
+    "reminders": [],
+}
 
 
 def _base_payload(unique: str) -> dict:
-    due = (datetime.now(tz=UTC) + timedelta(days=2)).isoformat()
-    return {
-        "title": f"E2E Task {unique}",
-        "description": "happy path",
-        "status": "open",
-        "priority": "medium",
-        "urgency": "medium",
-        "time_estimate": 2.5,
-        "due_date": due,
-        "tags": ["e2e"],
-        "assignee": "bot",
-        "reminders": [],
-    }
+    # The unique tag lets list_tasks narrow to this test's tasks server-side
+    return {**_PAYLOAD_TEMPLATE, "title": f"E2E Task {unique}", "tags": ["e2e", unique]}
 
 
-def _unwrap(result):
-    structured = getattr(result, "structured_content", None) or getattr(
-        result, "structuredContent", None
-    )
+def _unwrap(result: CallToolResult) -> Any:
+    # fastmcp's CallToolResult always carries structured_content; the text
+    # fallback only covers tools that return unstructured output
+    structured = result.structured_content
     if structured is not None:
         return structured
-    # Fallback: try to parse text content
-    for item in getattr(result, "content", []) or []:
-        text = getattr(item, "text", None)
-        if text:
-            try:
-                return json.loads(text)
-            except Exception:
-                return text
-    return result
+    # Parse the first text block; image/audio/resource blocks carry no text
+    text = next(
+        (block.text for block in result.content if isinstance(block, TextContent)),
+        None,
+    )
+    if not text:
+        return result
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+# Substrings of tool errors that mean the task store rejects writes (rather
+# than a bug): a branch-protected GitHub ref, or a read-only database file
+_WRITE_REJECTED = ("fast forward", "readonly database")
+
+
+@pytest.fixture(scope="session")
+def write_probe(mcp_client: SyncMCPClient) -> None:
+    """Skip all writing tests up front if a throwaway create is rejected."""
+    try:
+        result = mcp_client.call_tool(
+            "create_tasks", {"tasks": [{"title": _unique_name("e2e-probe")}]}
+        )
+    except ToolError as exc:
+        if any(marker in str(exc).lower() for marker in _WRITE_REJECTED):
+            pytest.skip(f"Task store rejects writes: {exc}")
+        raise
+    mcp_client.call_tool("delete_tasks", {"ids": _unwrap(result)["created"]})
+
+
+# Existing tasks are created up front in one create_tasks call and handed out
+# by purpose through the fixtures below; each key gets its own task
+_SEED_KEYS = ("update", "list")
+
+
+@pytest.fixture(scope="session")
+def seeded_tasks(
+    mcp_client: SyncMCPClient, write_probe: None
+) -> dict[str, tuple[int, dict]]:
+    """Create one task per seed key and map key -> (task_id, payload)."""
+    payloads = [_base_payload(f"{_unique_name()}.yaml") for _ in _SEED_KEYS]
+    result = mcp_client.call_tool("create_tasks", {"tasks": payloads})
+    created_ids = _unwrap(result)["created"]
+    return dict(zip(_SEED_KEYS, zip(created_ids, payloads)))
+
+
+@pytest.fixture()
+def task_to_update(seeded_tasks: dict[str, tuple[int, dict]]) -> tuple[int, dict]:
+    """A seeded (task_id, payload) that the requesting test may modify."""
+    return seeded_tasks["update"]
+
+
+@pytest.fixture()
+def task_to_list(seeded_tasks: dict[str, tuple[int, dict]]) -> tuple[int, dict]:
+    """A seeded (task_id, payload) left as created, for read-only checks."""
+    return seeded_tasks["list"]
 
 
+@pytest.mark.usefixtures("write_probe")
 def test_create_and_read_task(mcp_client: SyncMCPClient, unique_task_name: str) -> None:
     payload = _base_payload(unique_task_name)
     result = mcp_client.call_tool(
@@ -88,18 +144,34 @@ def test_create_and_read_task(mcp_client: SyncMCPClient, unique_task_name: str)
     assert read_data["tasks"][0]["task"]["title"] == payload["title"]
 
 
-def test_update_task(mcp_client: SyncMCPClient, unique_task_name: str) -> None:
-    payload = _base_payload(unique_task_name)
-    try:
-        result = mcp_client.call_tool(
-            "create_tasks",
-            {"tasks": [payload]},
-        )
-        task_id = _unwrap(result)["created"][0]
-    except ToolError as exc:
-        if "fast forward" in str(exc).lower():
-            pytest.skip("Branch protection or out-of-date ref prevents writes")
-        raise
+@pytest.mark.usefixtures("write_probe")
+def test_create_returns_stored_tasks(
+    mcp_client: SyncMCPClient, unique_task_name: str
+) -> None:
+    payloads = [
+        _base_payload(unique_task_name),
+        # tags=None is normalised to [] and created_at is caller-provided
+        {
+            "title": f"E2E Task {unique_task_name}-bare",
+            "tags": None,
+            "created_at": "2026-01-01T00:00:00+00:00",
+        },
+    ]
+    created = _unwrap(
+        mcp_client.call_tool("create_tasks", {"tasks": payloads, "return_tasks": True})
+    )
+    read_data = _unwrap(mcp_client.call_tool("read_tasks", {"ids": created["created"]}))
+
+    # Same ids, order and full bodies (timestamps and tags included)
+    assert created["tasks"] == read_data["tasks"]
+    assert created["tasks"][1]["task"]["tags"] == []
+    assert created["tasks"][1]["task"]["created_at"] == "2026-01-01T00:00:00+00:00"
+
+
+def test_update_task(
+    mcp_client: SyncMCPClient, task_to_update: tuple[int, dict]
+) -> None:
+    task_id, _ = task_to_update
 
     updated = mcp_client.call_tool(
         "update_tasks",
@@ -113,20 +185,23 @@ def test_update_task(mcp_client: SyncMCPClient, unique_task_name: str) -> None:
                     "time_estimate": 1.0,
                     "description": "done and high",
                 }
-            ]
+            ],
+            # The response carries the stored task; read_tasks is covered by
+            # test_create_and_read_task
+            "return_tasks": True,
         },
     )
     updated_data = _unwrap(updated)
     assert task_id in updated_data["updated"]
 
-    read_res = mcp_client.call_tool("read_tasks", {"ids": [task_id]})
-    task = _unwrap(read_res)["tasks"][0]["task"]
+    task = updated_data["tasks"][0]["task"]
     assert task["status"] == "done"
     assert task["priority"] == "high"
     assert task["urgency"] == "low"
     assert task["time_estimate"] == 1.0
 
 
+@pytest.mark.usefixtures("write_probe")
 def test_delete_tasks(mcp_client: SyncMCPClient, unique_task_name: str) -> None:
     """Test deleting single and multiple tasks."""
     payload1 = _base_payload(unique_task_name + "-1")
@@ -147,21 +222,28 @@ def test_delete_tasks(mcp_client: SyncMCPClient, unique_task_name: str) -> None:
     assert task_id_1 in delete_data["deleted"]
     assert delete_data["count"] == 1
 
-    # Verify first task is deleted
-    read_res = mcp_client.call_tool("read_tasks", {"ids": [task_id_1]})
+    # Verify first task is deleted and second task still exists
+    read_res, read_res2 = mcp_client.call_tools_batch(
+        [
+            ("read_tasks", {"ids": [task_id_1]}),
+            ("read_tasks", {"ids": [task_id_2]}),
+        ]
+    )
     read_data = _unwrap(read_res)
     assert len(read_data["tasks"]) == 0
 
-    # Verify second task still exists
-    read_res2 = mcp_client.call_tool("read_tasks", {"ids": [task_id_2]})
     read_data2 = _unwrap(read_res2)
     assert len(read_data2["tasks"]) == 1
     assert read_data2["tasks"][0]["id"] == task_id_2
 
-    # Delete second task
-    delete_res2 = mcp_client.call_tool("delete_tasks", {"ids": [task_id_2]})
+    # Delete second task; a repeated ID is reported once and never as missing
+    delete_res2 = mcp_client.call_tool(
+        "delete_tasks", {"ids": [task_id_2, task_id_2, -1]}
+    )
     delete_data2 = _unwrap(delete_res2)
-    assert task_id_2 in delete_data2["deleted"]
+    assert delete_data2["deleted"] == [task_id_2]
+    assert delete_data2["count"] == 1
+    assert delete_data2["not_found"] == [-1]
 
     # Try to delete non-existent task
     delete_res3 = mcp_client.call_tool("delete_tasks", {"ids": [99999]})
@@ -171,147 +253,83 @@ def test_delete_tasks(mcp_client: SyncMCPClient, unique_task_name: str) -> None:
 
 
 def test_list_filters_and_sort(
-    mcp_client: SyncMCPClient, unique_task_name: str
+    mcp_client: SyncMCPClient, task_to_list: tuple[int, dict]
 ) -> None:
-    payload = _base_payload(unique_task_name)
-    result = mcp_client.call_tool(
-        "create_tasks",
-        {"tasks": [payload]},
-    )
-    task_id = _unwrap(result)["created"][0]
+    task_id, payload = task_to_list
 
     list_res = mcp_client.call_tool(
         "list_tasks",
         {
             "status": ["open"],
-            "include_description": True,
+            "tags": payload["tags"],
+            "include_description": False,
             "page": 1,
-            "page_size": 100,
+            "page_size": 1,
         },
     )
     list_data = _unwrap(list_res)
-    listed = [t for t in list_data["tasks"] if t["id"] == task_id]
-    assert listed, "Task not found in list"
-    assert listed[0]["task"]["title"] == payload["title"]
+    assert list_data["total"] == 1, "Task not found in list"
+    listed = list_data["tasks"][0]
+    assert listed["id"] == task_id
+    assert listed["task"]["title"] == payload["title"]
 
 
+@pytest.mark.usefixtures("write_probe")
 def test_list_multiple_filters(
     mcp_client: SyncMCPClient, unique_task_name: str
 ) -> None:
     """Test filtering with multiple statuses, priorities, and urgencies."""
-    due = (datetime.now(tz=UTC) + timedelta(days=2)).isoformat()
-
-    try:
-        # Create task with status="open", priority="high", urgency="high"
-        result1 = mcp_client.call_tool(
-            "create_tasks",
-            {
-                "tasks": [
-                    {
-                        "title": "Multi-filter Task 1",
-                        "status": "open",
-                        "priority": "high",
-                        "urgency": "high",
-                        "due_date": due,
-                    }
-                ],
-            },
-        )
-        task1_id = _unwrap(result1)["created"][0]
-
-        # Create task with status="in-progress", priority="medium", urgency="medium"
-        result2 = mcp_client.call_tool(
-            "create_tasks",
-            {
-                "tasks": [
-                    {
-                        "title": "Multi-filter Task 2",
-                        "status": "in-progress",
-                        "priority": "medium",
-                        "urgency": "medium",
-                        "due_date": due,
-                    }
-                ],
-            },
-        )
-        task2_id = _unwrap(result2)["created"][0]
-
-        # Create task with status="done", priority="low", urgency="low"
-        result3 = mcp_client.call_tool(
-            "create_tasks",
-            {
-                "tasks": [
-                    {
-                        "title": "Multi-filter Task 3",
-                        "status": "done",
-                        "priority": "low",
-                        "urgency": "low",
-                        "due_date": due,
-                    }
-                ],
-            },
-        )
-        task3_id = _unwrap(result3)["created"][0]
-    except ToolError as exc:
-        if "fast forward" in str(exc).lower():
-            pytest.skip("Branch protection or out-of-date ref prevents writes")
-        raise
-
-    # Test filtering by multiple statuses
-    list_res = mcp_client.call_tool(
-        "list_tasks",
-        {
-            "status": ["open", "in-progress"],
-            "page_size": 100,
-        },
-    )
-    list_data = _unwrap(list_res)
-    listed = [t for t in list_data["tasks"] if t["id"] in [task1_id, task2_id]]
-    assert len(listed) >= 2, "Should find tasks with status 'open' or 'in-progress'"
-
-    # Test filtering by multiple priorities
-    list_res = mcp_client.call_tool(
-        "list_tasks",
-        {
-            "priority": ["high", "medium"],
-            "page_size": 100,
-        },
-    )
-    list_data = _unwrap(list_res)
-    listed = [t for t in list_data["tasks"] if t["id"] in [task1_id, task2_id]]
-    assert len(listed) >= 2, "Should find tasks with priority 'high' or 'medium'"
-
-    # Test filtering by multiple urgencies
-    list_res = mcp_client.call_tool(
-        "list_tasks",
-        {
-            "urgency": ["high", "medium"],
-            "page_size": 100,
-        },
-    )
-    list_data = _unwrap(list_res)
-    listed = [t for t in list_data["tasks"] if t["id"] in [task1_id, task2_id]]
-    assert len(listed) >= 2, "Should find tasks with urgency 'high' or 'medium'"
-
-    # Test combined filters: multiple statuses AND multiple priorities
-    list_res = mcp_client.call_tool(
-        "list_tasks",
+    due = _DUE_IN_TWO_DAYS
+    variants = [
+        # (status, priority, urgency)
+        ("open", "high", "high"),
+        ("in-progress", "medium", "medium"),
+        ("done", "low", "low"),
+    ]
+
+    tasks = [
         {
+            "title": f"Multi-filter Task {index}",
+            "status": status,
+            "priority": priority,
+            "urgency": urgency,
+            "due_date": due,
+            "tags": [unique_task_name],
+        }
+        for index, (status, priority, urgency) in enumerate(variants, start=1)
+    ]
+
+    # One create_tasks call (one request, one transaction) for all three
+    result = mcp_client.call_tool("create_tasks", {"tasks": tasks})
+    task1_id, task2_id, task3_id = _unwrap(result)["created"]
+
+    filters = {
+        "status 'open' or 'in-progress'": {"status": ["open", "in-progress"]},
+        "priority 'high' or 'medium'": {"priority": ["high", "medium"]},
+        "urgency 'high' or 'medium'": {"urgency": ["high", "medium"]},
+        # Combined filters: multiple statuses AND multiple priorities
+        "both status and priority filters": {
             "status": ["open", "in-progress"],
             "priority": ["high", "medium"],
-            "page_size": 100,
         },
+    }
+    # The list queries are independent, so send them in one batch; the unique
+    # tag limits each page to this test's tasks
+    narrow = {"tags": [unique_task_name], "page_size": len(tasks)}
+    results = mcp_client.call_tools_batch(
+        [("list_tasks", {**args, **narrow}) for args in filters.values()]
     )
-    list_data = _unwrap(list_res)
-    listed = [t for t in list_data["tasks"] if t["id"] in [task1_id, task2_id]]
-    assert len(listed) >= 2, (
-        "Should find tasks matching both status and priority filters"
-    )
+    expected_ids = {task1_id, task2_id}
+    for description, list_res in zip(filters, results):
+        listed_ids = {t["id"] for t in _unwrap(list_res)["tasks"]}
+        # The done/low/low task matches none of the filters
+        assert task3_id not in listed_ids, f"Should exclude task 3 for {description}"
+        assert listed_ids == expected_ids, f"Should find tasks matching {description}"
 
 
 def test_reminder_tools_happy_path(mcp_client: SyncMCPClient) -> None:
     due_at = (datetime.now(tz=UTC) + timedelta(minutes=2)).isoformat()
-    reminder_title = f"e2e-reminder-{uuid.uuid4().hex[:8]}"
+    reminder_title = _unique_name("e2e-reminder")
 
     set_res = mcp_client.call_tool(
         "set_reminders",
@@ -334,7 +352,7 @@ def test_reminder_tools_happy_path(mcp_client: SyncMCPClient) -> None:
     list_res = mcp_client.call_tool("list_reminders", {})
     list_data = _unwrap(list_res)
     assert list_data["status"] == "success"
-    assert reminder_id in list_data["output"]
+    assert reminder_id in {r["id"] for r in list_data["reminders"]}
 
     remove_res = mcp_client.call_tool("remove_reminders", {"ids": [reminder_id]})
     remove_data = _unwrap(remove_res)
@@ -343,4 +361,32 @@ def test_reminder_tools_happy_path(mcp_client: SyncMCPClient) -> None:
     list_after = mcp_client.call_tool("list_reminders", {})
     list_after_data = _unwrap(list_after)
     if list_after_data.get("status") == "success":
-        assert reminder_id not in list_after_data["output"]
+        assert reminder_id not in {r["id"] for r in list_after_data["reminders"]}
+
+
+def test_set_reminders_results_follow_input_order(
+    mcp_client: SyncMCPClient,
+) -> None:
+    due_at = (datetime.now(tz=UTC) + timedelta(minutes=2)).isoformat()
+    title = _unique_name("e2e-reminder")
+    reminders = [
+        {"title": f"{title}-missing", "message": "no due_at"},
+        {"title": f"{title}-invalid", "message": "bad due_at", "due_at": "soon"},
+        {"title": f"{title}-valid", "message": "ok", "due_at": due_at},
+        {"title": f"{title}-invalid2", "message": "bad", "due_at": "2026-13-01"},
+    ]
+
+    set_res = mcp_client.call_tool("set_reminders", {"reminders": reminders})
+    missing, invalid, valid, invalid2 = _unwrap(set_res)["results"]
+
+    assert missing == {"error": "Missing due_at timestamp", "reminder": reminders[0]}
+    assert invalid["reminder"] == reminders[1]
+    assert "invalid due_at" in invalid["error"]
+    assert valid["status"] == "added"
+    assert invalid2["reminder"] == reminders[3]
+    assert "invalid due_at" in invalid2["error"]
+
+    list_data = _unwrap(mcp_client.call_tool("list_reminders", {}))
+    titles_by_id = {r["id"]: r["title"] for r in list_data["reminders"]}
+    assert titles_by_id[valid["id"]] == f"{title}-valid"
+    mcp_client.call_tool("remove_reminders", {"ids": [valid["id"]]})
@@ -0,0 +1,124 @@
+"""Tests for the reminder daemon's scheduling helpers and main loop."""
+
+from __future__ import annotations
+
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from todo_list_mcp.reminder_cli import (
+    Reminder,
+    ReminderDaemon,
+    ReminderStore,
+    _due_schedule,
+    _seconds_until_next_due,
+    app,
+)
+
+
+def _reminder(reminder_id: str, due_at: str) -> Reminder:
+    return Reminder(
+        id=reminder_id,
+        title=reminder_id,
+        message="",
+        due_at=due_at,
+        created_at="2026-01-01T00:00:00+00:00",
+    )
+
+
+def _in(seconds: float) -> str:
+    return (datetime.now(tz=UTC) + timedelta(seconds=seconds)).isoformat()
+
+
+def test_due_schedule_orders_by_due_time_and_drops_unparseable() -> None:
+    reminders = [
+        _reminder("later", "2026-01-02T00:00:00Z"),
+        _reminder("broken", "tomorrow"),
+        _reminder("naive", "2026-01-01T12:00:00"),
+        _reminder("offset", "2026-01-01T10:00:00+01:00"),
+    ]
+
+    schedule = _due_schedule(reminders)
+
+    assert [r.id for _, r in schedule] == ["offset", "naive", "later"]
+    assert schedule[0][0] == datetime(2026, 1, 1, 9, tzinfo=UTC).timestamp()
+
+
+@pytest.mark.parametrize(
+    ("offsets", "expected"),
+    [
+        ([], 1.0),  # nothing scheduled: poll again after the cap
+        ([-30.0], 0.0),  # already overdue
+        ([3600.0], 1.0),  # far ahead: capped
+    ],
+)
+def test_seconds_until_next_due_is_clamped(
+    offsets: list[float], expected: float
+) -> None:
+    now = time.time()
+    schedule = [(now + offset, _reminder("r", "")) for offset in offsets]
+    assert _seconds_until_next_due(schedule, 1.0) == expected
+
+
+def test_seconds_until_next_due_within_cap() -> None:
+    schedule = [(time.time() + 5.0, _reminder("r", ""))]
+    assert 4.0 < _seconds_until_next_due(schedule, 10.0) <= 5.0
+
+
+def test_run_tick_removes_only_delivered_reminders(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = ReminderStore(tmp_path / "reminders.json")
+    store.save([_reminder("due", _in(-60)), _reminder("pending", _in(3600))])
+    daemon = ReminderDaemon(store)
+
+    # Another CLI process adds a reminder right after the daemon's snapshot;
+    # it is already due but wasn't delivered, so it must survive the removal
+    load = store.load
+
+    def load_then_add() -> list[Reminder]:
+        reminders = load()
+        monkeypatch.setattr(store, "load", load)
+        store.add(_reminder("late", _in(-1)))
+        return reminders
+
+    monkeypatch.setattr(store, "load", load_then_add)
+    delivered: list[str] = []
+    monkeypatch.setattr(daemon, "_deliver", lambda r: delivered.append(r.id))
+    # Run a single tick: the wait at the end of the loop stops it
+    monkeypatch.setattr(
+        daemon._shutdown, "wait", lambda timeout: daemon._shutdown.set()
+    )
+
+    daemon._run()
+    daemon._delivery_pool.shutdown(wait=True)
+
+    assert delivered == ["due"]
+    assert sorted(r.id for r in load()) == ["late", "pending"]
+
+
+def test_add_batch_without_valid_items_leaves_store_untouched(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def add_many(self: ReminderStore, reminders: list[Reminder]) -> None:
+        raise AssertionError("store must not be rewritten")
+
+    monkeypatch.setattr(ReminderStore, "add_many", add_many)
+
+    result = CliRunner().invoke(
+        app,
+        ["add-batch", "--porcelain"],
+        input='[{"title": "a"}, {"title": "b", "due_at": "soon"}]',
+    )
+
+    assert result.exit_code == 0
+    assert (
+        result.stdout.splitlines()
+        == [
+            "ERROR invalid due_at timestamp (use ISO 8601)",
+        ]
+        * 2
+    )
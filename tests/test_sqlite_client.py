@@ -0,0 +1,104 @@
+"""Tests for SQLiteClient against a file-backed database."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+from sqlalchemy import select, text
+
+from todo_list_mcp.models import Base, Task, backfill_due_ts
+from todo_list_mcp.sqlite_client import SQLiteClient
+
+
+@pytest.fixture()
+def db_client(tmp_path: Path):
+    client = SQLiteClient(f"sqlite:///{tmp_path / 'test.db'}")
+    client.create_tables(Base)
+    yield client
+    client.close()
+
+
+def test_vacuum_runs_outside_a_transaction(db_client: SQLiteClient) -> None:
+    db_client.vacuum()
+
+    # The pooled connection must still get explicit transactions afterwards
+    with db_client.transaction() as session:
+        session.add(Task(title="after vacuum"))
+    db_client.vacuum()
+
+    with db_client.session() as session:
+        assert session.scalars(select(Task.title)).all() == ["after vacuum"]
+
+
+# tasks table as created by 0.3.x, before due_ts and its indexes existed
+_LEGACY_TASKS_DDL = (
+    """
+    CREATE TABLE tasks (
+        id INTEGER NOT NULL PRIMARY KEY,
+        title VARCHAR NOT NULL,
+        description VARCHAR,
+        status VARCHAR NOT NULL,
+        priority VARCHAR NOT NULL,
+        urgency VARCHAR NOT NULL,
+        time_estimate FLOAT,
+        due_date VARCHAR,
+        tags JSON NOT NULL,
+        assignee VARCHAR,
+        created_at VARCHAR NOT NULL,
+        updated_at VARCHAR NOT NULL
+    )
+    """,
+    *(
+        f"CREATE INDEX ix_tasks_{column} ON tasks ({column})"
+        for column in ("title", "status", "priority", "urgency", "due_date", "assignee")
+    ),
+)
+
+
+def test_upgrade_tables_migrates_legacy_tasks_table(db_client: SQLiteClient) -> None:
+    db_client.drop_tables(Base)
+    with db_client.transaction() as session:
+        for statement in _LEGACY_TASKS_DDL:
+            session.execute(text(statement))
+        for task_id, due_date in (
+            (1, "2026-01-15T10:00:00Z"),
+            (2, "2026-03-01"),
+            (3, "next week"),
+            (4, None),
+        ):
+            session.execute(
+                text(
+                    "INSERT INTO tasks VALUES (:id, 'legacy', NULL, 'open', "
+                    "'medium', 'medium', NULL, :due_date, '[]', NULL, '', '')"
+                ),
+                {"id": task_id, "due_date": due_date},
+            )
+
+    db_client.create_tables(Base)
+    assert db_client.upgrade_tables(Base) == ["tasks.due_ts"]
+    with db_client.transaction() as session:
+        assert backfill_due_ts(session) == 2
+
+    with db_client.session() as session:
+        index_names = set(
+            session.scalars(
+                text(
+                    "SELECT name FROM sqlite_master "
+                    "WHERE type = 'index' AND tbl_name = 'tasks'"
+                )
+            )
+        )
+        due_ts = dict(session.execute(select(Task.id, Task.due_ts)).all())
+    tasks_table = Base.metadata.tables["tasks"]
+    assert index_names == {index.name for index in tasks_table.indexes}
+    assert due_ts == {
+        1: datetime(2026, 1, 15, 10, tzinfo=UTC).timestamp(),
+        2: datetime(2026, 3, 1, tzinfo=UTC).timestamp(),
+        3: None,
+        4: None,
+    }
+
+    # Already upgraded: nothing left to add
+    assert db_client.upgrade_tables(Base) == []